@@ -7,13 +7,18 @@ is to make it easy to answer “why did this happen?” by walking from the inpu
 all the way to the final output and UI patch for a single ``requestId``.
 
 Launch with:
-    python dev_log_viewer.py --port 8000
+    python dev_log_viewer.py --port 8000 [--reuse-port]
 
 Key endpoints (all served from this single file to stay dependency-free):
 - /dev/logs/                      → List view with filters
 - /dev/logs/<date>/<requestId>    → Detail view (shares the same HTML shell)
 - /dev/logs/api/runs              → JSON inventory of bundles + derived stats
-- /dev/logs/api/run/<date>/<id>   → JSON detail payload for the UI tabs
+- /dev/logs/api/runs?format=ndjson → same inventory, streamed one bundle per line
+  (both accept ?missing=&duration=&tokens=&tag= list-view filters)
+- /dev/logs/api/run/<date>/<id>   → JSON detail header, Request tab and notes
+- /dev/logs/api/run/<date>/<id>/<section> → one tab's slice, on demand
+  (transcript, evidence, assets, diff)
+- /dev/logs/api/run/<date>/<id>/file/<key> → one raw trace/output file, on demand
 
 Why plain http.server instead of a heavier framework?
 - Keeps requirements lean (no extra pip installs).
@@ -25,21 +30,70 @@ Why plain http.server instead of a heavier framework?
 from __future__ import annotations
 
 import argparse
+import email.utils
+import functools
+import gzip
+import hashlib
 import io
 import json
+import mmap
 import os
+import re
+import socket
+import threading
+import time
 import urllib.parse
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    # Optional speedup: orjson parses/serializes bundle JSON several times
+    # faster and works on bytes directly. The viewer stays dependency-free, so
+    # we quietly fall back to the stdlib when it is not installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None  # type: ignore[assignment]
+
+# The list-view counts come from the writer's helpers, so a summary stored in
+# index.json and one derived here for an older bundle always agree.
+from postcall_trace import missing_field_count, usage_token_count
 
 # Root where postcall_trace.py writes bundles. Kept configurable for tests.
 LOG_ROOT = Path(".dal_logs/postcall/runs")
 NOTES_PATH = LOG_ROOT.parent / "70_notes.md"
 PROBE_PLAN_QUEUE_PATH = LOG_ROOT.parent / "probe_plan_review_queue.jsonl"
+# Bodies smaller than this go out uncompressed; gzip overhead is not worth it.
+GZIP_MIN_BYTES = 1024
+# Detail views first look for a request's notes in this many trailing bytes.
+NOTES_TAIL_BYTES = 64 * 1024
+# Idle keep-alive connections are closed after this many seconds.
+KEEPALIVE_IDLE_SECONDS = 15
+# Upper bound on threads used to load bundles for the list view.
+INVENTORY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Smaller trees load inline; starting a pool costs more than it overlaps.
+INVENTORY_POOL_MIN_BUNDLES = 8
+# A built runs inventory is reused for this long while the tree signature holds.
+RUNS_CACHE_TTL_SECONDS = 2.0
+# The SPA shell may be reused without revalidation for this long. Not
+# ``immutable``: a restarted viewer can serve a different shell.
+HTML_SHELL_CACHE_CONTROL = "public, max-age=60"
+
+# Parsed 70_notes.md plus the (path, mtime_ns, size) it was parsed from.
+# _NOTES_LOCK serializes note writes and guards this cache.
+_NOTES_CACHE: Dict[str, Any] = {"key": None, "index": {}}
+_NOTES_LOCK = threading.Lock()
+# (tree signature, monotonic build time, runs, encoded body, ETag) of the
+# last runs inventory.
+_RUNS_CACHE: Optional[Tuple[Any, float, List[Dict[str, Any]], bytes, str]] = None
+# Mixed into signature-based ETags so a restarted (possibly updated) viewer
+# never confirms a payload an older process produced.
+_ETAG_SALT = os.urandom(8).hex()
 
 
 def _today_str() -> str:
@@ -47,22 +101,158 @@ def _today_str() -> str:
     return datetime.utcnow().strftime("%Y%m%d")
 
 
+# Digit runs long enough to be an integer orjson cannot hold (see _json_loads).
+_WIDE_DIGITS = re.compile(rb"\d{19}")
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes (both orjson and json accept UTF-8 bytes).
+
+    orjson rejects NaN/Infinity (which ``json.dumps`` writes by default), so
+    those files fall back to the stdlib parser instead of looking empty.
+    Integers outside the 64-bit range are not rejected but silently read as
+    floats, so any 19+ digit run (the shortest such literal is
+    -9223372036854775809) sends the data to the stdlib too; a match inside
+    a string only costs the faster parse.
+    """
+    if orjson is not None and _WIDE_DIGITS.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(payload: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize ``payload`` to UTF-8 JSON bytes.
+
+    ``indent`` means two spaces on both backends, so diff output and the
+    pre-rendered HTML read the same whichever one is active.
+    """
+    if orjson is not None:
+        # Non-str keys are stringified like the stdlib does instead of raising.
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(payload, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which only the stdlib can write.
+            pass
+    # Compact separators match orjson byte for byte (and keep bodies smaller).
+    separators = (",", ": ") if indent else (",", ":")
+    return json.dumps(
+        payload, ensure_ascii=False, indent=2 if indent else None, separators=separators, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def _safe_json_html(payload: Any) -> str:
+    """
+    Pretty-print ``payload`` as JSON already escaped for a ``<pre>`` block.
+
+    Doing this server-side keeps large request payloads off the single JS
+    thread; each ``bytes.replace`` is one C-level pass over the buffer.
+    """
+    body = _json_dumps(payload, indent=True)
+    return body.replace(b"&", b"&amp;").replace(b"<", b"&lt;").replace(b">", b"&gt;").decode("utf-8")
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file once per (path, mtime, size) generation.
+
+    The stat fields only serve as the cache key: a rewritten file produces a
+    new key, and stale entries simply age out of the LRU. Callers share the
+    returned object, so treat it as read-only.
+    """
+    try:
+        # Raw bytes skip the decode step (both parsers accept UTF-8), and a
+        # plain open() on the str skips building a Path for every read.
+        with open(path_str, "rb") as handle:
+            return _json_loads(handle.read())
+    except ValueError:
+        # Defensive: malformed JSON should not crash the UI; report as empty.
+        # (json.JSONDecodeError and orjson.JSONDecodeError both subclass it.)
+        return {}
+
+
 def _read_json_if_exists(path: Path) -> Dict[str, Any]:
     """Return JSON content if the file exists, otherwise an empty dict."""
-    if not path.exists():
+    try:
+        # One stat doubles as the existence check and the cache key.
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
+    return _read_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _scan_bundle_files(run_path: Path) -> Dict[str, os.DirEntry]:
+    """List a bundle folder once, keyed by file name ({} if the folder is missing)."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        # Defensive: malformed JSON should not crash the UI; report as empty.
+        with os.scandir(run_path) as entries:
+            return {entry.name: entry for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
         return {}
 
 
-def _read_text_if_exists(path: Path) -> str:
-    """Return UTF-8 text if present; otherwise an empty string."""
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
+def _read_json_entry(entry: Optional[os.DirEntry]) -> Dict[str, Any]:
+    """:func:`_read_json_if_exists` for a DirEntry from :func:`_scan_bundle_files`."""
+    if entry is None:
+        return {}
+    stat = entry.stat()
+    # entry.path matches str(run_path / name), so both helpers share cache keys.
+    return _read_json_cached(entry.path, stat.st_mtime_ns, stat.st_size)
+
+
+def _bundle_tree_signature() -> Tuple[Tuple[str, int], ...]:
+    """
+    Cheap fingerprint of LOG_ROOT and its date buckets.
+
+    A new request folder only bumps the mtime of its date bucket (not of
+    LOG_ROOT), so both levels go into the signature. This costs one listing
+    of LOG_ROOT plus one stat per date bucket, instead of a full tree walk.
+    """
+    try:
+        signature = [(str(LOG_ROOT), LOG_ROOT.stat().st_mtime_ns)]
+        with os.scandir(LOG_ROOT) as entries:
+            buckets = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+    except FileNotFoundError:
+        return ()
+    signature.extend((entry.name, entry.stat().st_mtime_ns) for entry in buckets)
+    return tuple(signature)
+
+
+def _sorted_subdirs(path: Path) -> List[os.DirEntry]:
+    """
+    List child directories sorted by name.
+
+    ``os.scandir`` hands back DirEntry objects whose ``is_dir()`` answer comes
+    from the directory listing itself, so we avoid one stat per child compared
+    to ``Path.iterdir()`` + ``Path.is_dir()``.
+    """
+    with os.scandir(path) as entries:
+        return sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+
+
+@functools.lru_cache(maxsize=1)
+def _gather_bundle_paths_cached(signature: Tuple[Tuple[str, int], ...]) -> Tuple[Tuple[str, Path], ...]:
+    """Walk the bundle tree once per signature (see :func:`_gather_bundle_paths`)."""
+    bundles: List[Tuple[str, Path]] = []
+    # signature[0] is LOG_ROOT itself; the rest already lists the date buckets
+    # in name order, so LOG_ROOT is not scanned a second time.
+    for date_bucket, _ in signature[1:]:
+        try:
+            request_dirs = _sorted_subdirs(LOG_ROOT / date_bucket)
+        except FileNotFoundError:
+            # Removed since the signature was taken; the next call re-keys.
+            continue
+        bundles.extend((date_bucket, Path(request_dir.path)) for request_dir in request_dirs)
+    return tuple(bundles)
 
 
 def _gather_bundle_paths() -> List[Tuple[str, Path]]:
@@ -71,49 +261,68 @@ def _gather_bundle_paths() -> List[Tuple[str, Path]]:
 
     The directory layout is expected to be:
     .dal_logs/postcall/runs/YYYYMMDD/<requestId>/...
+
+    The walk itself is memoized on :func:`_bundle_tree_signature`, so repeated
+    list-view refreshes skip it entirely until a bundle is added or removed.
     """
-    bundles: List[Tuple[str, Path]] = []
-    if not LOG_ROOT.exists():
-        return bundles
-    for date_bucket in sorted(LOG_ROOT.iterdir()):
-        if not date_bucket.is_dir():
-            continue
-        for request_dir in sorted(date_bucket.iterdir()):
-            if request_dir.is_dir():
-                bundles.append((date_bucket.name, request_dir))
-    return bundles
+    return list(_gather_bundle_paths_cached(_bundle_tree_signature()))
+
+
+@functools.lru_cache(maxsize=1)
+def _bundle_index_cached(signature: Tuple[Tuple[str, int], ...]) -> Dict[str, Tuple[str, Path]]:
+    """
+    Map requestId -> (date_bucket, path) for one tree signature.
+
+    ``setdefault`` keeps the first match in walk order, matching the old
+    linear scan when the same requestId shows up under several dates.
+    """
+    index: Dict[str, Tuple[str, Path]] = {}
+    for date_bucket, run_path in _gather_bundle_paths_cached(signature):
+        index.setdefault(run_path.name, (date_bucket, run_path))
+    return index
 
 
 def _find_bundle_by_request_id(request_id: str) -> Optional[Tuple[str, Path]]:
     """
     Locate a bundle by request id across all date buckets.
 
-    The search is intentionally linear because bundle counts stay small in the
-    dev-only viewer. Keeping it simple avoids extra indexes while still being
-    easy to read and extend for future contributors.
+    Lookups hit a dict rebuilt only when the tree signature changes, so a
+    download no longer re-walks every date bucket.
     """
-    for date_bucket, run_path in _gather_bundle_paths():
-        if run_path.name == request_id:
-            return date_bucket, run_path
-    return None
+    return _bundle_index_cached(_bundle_tree_signature()).get(request_id)
+
+
+def _iter_bundle_files(root: Path) -> Iterator[Path]:
+    """
+    Yield every file under ``root`` in name order.
+
+    Like :func:`_sorted_subdirs`, this trusts the file type reported by
+    ``os.scandir`` instead of stat-ing each path. Symlinked directories are
+    not descended into, so a stray link cannot loop the walk.
+    """
+    with os.scandir(root) as entries:
+        children = sorted(entries, key=lambda entry: entry.name)
+    for entry in children:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_bundle_files(Path(entry.path))
+        elif entry.is_file():
+            yield Path(entry.path)
 
 
-def _zip_bundle(path: Path) -> bytes:
+def _zip_bundle(path: Path, out: io.BufferedIOBase | _ChunkedWriter) -> None:
     """
-    Create an in-memory ZIP archive of a bundle directory.
+    Stream a ZIP archive of a bundle directory into ``out``.
 
-    Using BytesIO keeps the endpoint dependency-free while still letting the UI
-    stream a file download response.
+    ``zipfile`` supports unseekable outputs (it falls back to data
+    descriptors), so the handler can pass ``self.wfile`` directly. Peak memory
+    stays around one deflate window instead of the whole archive.
     """
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                arcname = file_path.relative_to(path.parent)
-                # Educational comment: arcname preserves the requestId folder so
-                # the unzip path stays clear to the reader.
-                zf.write(file_path, arcname)
-    return buffer.getvalue()
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for file_path in _iter_bundle_files(path):
+            arcname = file_path.relative_to(path.parent)
+            # Educational comment: arcname preserves the requestId folder so
+            # the unzip path stays clear to the reader.
+            zf.write(file_path, arcname)
 
 
 def _dev_bundle_download_enabled() -> bool:
@@ -136,45 +345,6 @@ def _dev_mutation_enabled() -> bool:
     return _dev_bundle_download_enabled()
 
 
-def _token_count(meta: Dict[str, Any]) -> Optional[int]:
-    """
-    Calculate total tokens from an OpenAI usage object if present.
-    """
-    usage = meta.get("usage") if isinstance(meta, dict) else {}
-    if not isinstance(usage, dict):
-        return None
-    prompt = usage.get("prompt_tokens")
-    completion = usage.get("completion_tokens")
-    if isinstance(prompt, int) and isinstance(completion, int):
-        return prompt + completion
-    if isinstance(prompt, int):
-        return prompt
-    return None
-
-
-def _compute_missing_count(final_trace: Dict[str, Any], sanitize_report: Dict[str, Any]) -> int:
-    """
-    Estimate how many extraction fields look incomplete.
-
-    We combine two signals:
-    - sanitize_report per-field reasons that indicate missing/invalid evidence.
-    - final_trace perField entries that lack a value.
-    """
-    missing = 0
-    per_field_report = sanitize_report.get("perField", []) if isinstance(sanitize_report, dict) else []
-    for field in per_field_report:
-        reason = field.get("reason")
-        matched_by = field.get("matchedBy")
-        if reason in {"invalid_turnIndex", "snippet_not_found", "value_not_found"} or matched_by == "none":
-            missing += 1
-
-    extraction_trace = final_trace.get("extractionTrace", {}) if isinstance(final_trace, dict) else {}
-    for field in extraction_trace.get("perField", []):
-        if not field.get("value") and not field.get("requestedSnippet"):
-            missing += 1
-    return missing
-
-
 def _extract_tags(request_json: Dict[str, Any], index_json: Dict[str, Any]) -> List[str]:
     """
     Collect tag-like labels from either the request payload or the index.
@@ -190,47 +360,55 @@ def _extract_tags(request_json: Dict[str, Any], index_json: Dict[str, Any]) -> L
     return tags
 
 
-def _extract_transcript(request_json: Dict[str, Any], trace_final: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """
-    Build a normalized transcript list of {idx, speaker, text}.
-    """
-    candidates: List[Any] = []
-    # Common places the transcript may live.
+def _normalize_turn(turn: Any, idx: int) -> Optional[Dict[str, Any]]:
+    """Shape one transcript turn as {idx, speaker, text}, or None if it has no text."""
+    if isinstance(turn, dict):
+        text = turn.get("text") or turn.get("content") or turn.get("message")
+        if text is None:
+            return None
+        speaker = turn.get("speaker") or turn.get("role") or turn.get("sender") or "unknown"
+        return {"idx": idx, "speaker": speaker, "text": str(text)}
+    if isinstance(turn, str):
+        return {"idx": idx, "speaker": "unknown", "text": turn}
+    return None
+
+
+def _transcript_candidates(request_json: Dict[str, Any], trace_final: Dict[str, Any]) -> Iterator[Any]:
+    """Yield the places a transcript may live, in priority order, without building them all up front."""
     for key in ("transcriptTurns", "transcript"):
         if key in request_json:
-            candidates.append(request_json[key])
+            yield request_json[key]
     input_block = request_json.get("input", {})
     if isinstance(input_block, dict):
         for key in ("transcriptTurns", "transcript"):
             if key in input_block:
-                candidates.append(input_block[key])
+                yield input_block[key]
     extraction_trace = trace_final.get("extractionTrace", {}) if isinstance(trace_final, dict) else {}
-    if "turns" in extraction_trace:
-        candidates.append(extraction_trace["turns"])
-
-    def normalize_turn(turn: Any, idx: int) -> Optional[Dict[str, Any]]:
-        if isinstance(turn, dict):
-            text = turn.get("text") or turn.get("content") or turn.get("message")
-            if text is None:
-                return None
-            speaker = turn.get("speaker") or turn.get("role") or turn.get("sender") or "unknown"
-            return {"idx": idx, "speaker": speaker, "text": str(text)}
-        if isinstance(turn, str):
-            return {"idx": idx, "speaker": "unknown", "text": turn}
-        return None
+    if isinstance(extraction_trace, dict) and "turns" in extraction_trace:
+        yield extraction_trace["turns"]
+
+
+def _extract_transcript(request_json: Dict[str, Any], trace_final: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build a normalized transcript list of {idx, speaker, text}.
 
-    for candidate in candidates:
+    The first source that yields any turns wins, so later sources are never
+    looked at (in practice exactly one of them is populated).
+    """
+    for candidate in _transcript_candidates(request_json, trace_final):
         if isinstance(candidate, list) and candidate:
-            transcript: List[Dict[str, Any]] = []
-            for idx, turn in enumerate(candidate):
-                normalized = normalize_turn(turn, idx)
-                if normalized:
-                    transcript.append(normalized)
+            transcript: List[Dict[str, Any]] = [
+                normalized for idx, turn in enumerate(candidate) if (normalized := _normalize_turn(turn, idx))
+            ]
             if transcript:
                 return transcript
     return []
 
 
+# Shared read-only stand-in for fields that have no sanitize reason.
+_EMPTY_REASON: Mapping[str, Any] = MappingProxyType({})
+
+
 def _extract_evidence_map(trace_final: Dict[str, Any], sanitize_report: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Combine per-field extraction info with sanitize reasons for a single table.
@@ -238,30 +416,26 @@ def _extract_evidence_map(trace_final: Dict[str, Any], sanitize_report: Dict[str
     extraction_trace = trace_final.get("extractionTrace", {}) if isinstance(trace_final, dict) else {}
     per_field = extraction_trace.get("perField", []) if isinstance(extraction_trace, dict) else []
     reasons = sanitize_report.get("perField", []) if isinstance(sanitize_report, dict) else []
-    reasons_by_field = {}
-    for reason in reasons:
-        name = reason.get("field")
-        if name not in reasons_by_field:
-            reasons_by_field[name] = []
-        reasons_by_field[name].append(reason)
-
-    rows: List[Dict[str, Any]] = []
-    for entry in per_field:
-        field_name = entry.get("field") or entry.get("name") or entry.get("path") or ""
-        reason_candidates = reasons_by_field.get(field_name) or []
-        reason = reason_candidates[0] if reason_candidates else {}
-        rows.append(
-            {
-                "field": field_name,
-                "status": reason.get("reason") or reason.get("matchedBy") or "ok",
-                "turnIndex": entry.get("turnIndex"),
-                "snippet": entry.get("requestedSnippet") or entry.get("snippet") or "",
-                "value": entry.get("value"),
-                "matchedBy": reason.get("matchedBy"),
-                "turnTextPreview": reason.get("turnTextPreview"),
-                "reason": reason.get("reason"),
-            }
-        )
+    # Only the first reason per field is ever shown; walking the reasons in
+    # reverse lets a single dict comprehension keep that one.
+    reasons_by_field: Dict[Any, Dict[str, Any]] = {reason.get("field"): reason for reason in reversed(reasons)}
+    # The one-element ``for`` clauses bind per-entry locals inside the
+    # comprehension (compiled to plain assignments since Python 3.9).
+    rows: List[Dict[str, Any]] = [
+        {
+            "field": field_name,
+            "status": reason.get("reason") or reason.get("matchedBy") or "ok",
+            "turnIndex": entry.get("turnIndex"),
+            "snippet": entry.get("requestedSnippet") or entry.get("snippet") or "",
+            "value": entry.get("value"),
+            "matchedBy": reason.get("matchedBy"),
+            "turnTextPreview": reason.get("turnTextPreview"),
+            "reason": reason.get("reason"),
+        }
+        for entry in per_field
+        for field_name in (entry.get("field") or entry.get("name") or entry.get("path") or "",)
+        for reason in (reasons_by_field.get(field_name, _EMPTY_REASON),)
+    ]
     return rows
 
 
@@ -290,6 +464,41 @@ def _ensure_notes_file() -> List[str]:
     return NOTES_PATH.read_text(encoding="utf-8").splitlines()
 
 
+def _append_note_in_place(header_line: str, entry_line: str) -> bool:
+    """
+    Append ``entry_line`` to the end of 70_notes.md without rewriting it.
+
+    This covers the common cases while annotating: the request's section is
+    the last one in the file, or the section does not exist yet. Returns
+    False when the caller must fall back to the full rewrite (the section
+    sits mid-file, or the file tail was hand-edited). The header scan runs on
+    an mmap, so nothing is decoded or copied into Python strings.
+    """
+    header = header_line.encode("utf-8")
+    with NOTES_PATH.open("r+b") as handle:
+        if os.fstat(handle.fileno()).st_size < 2:
+            return False
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The rewrite path always leaves exactly one trailing newline; if
+            # that does not hold, appending would not match its output.
+            if mm[-1:] != b"\n" or mm[-2:-1].isspace():
+                return False
+            last_start = mm.rfind(b"\n## ") + 1
+            if last_start == 0 and mm[:3] != b"## ":
+                last_header = None
+            else:
+                last_header = mm[last_start : mm.find(b"\n", last_start)]
+            if last_header == header:
+                addition = f"{entry_line}\n"
+            elif mm[: len(header) + 1] == header + b"\n" or mm.find(b"\n" + header + b"\n") != -1:
+                return False
+            else:
+                addition = f"\n{header_line}\n{entry_line}\n"
+        handle.seek(0, os.SEEK_END)
+        handle.write(addition.encode("utf-8"))
+    return True
+
+
 def _append_note_for_request(request_id: str, note: str) -> Dict[str, str]:
     """
     Append a timestamped note under the requestId heading inside 70_notes.md.
@@ -302,6 +511,18 @@ def _append_note_for_request(request_id: str, note: str) -> Dict[str, str]:
     entry_line = f"- {timestamp}: {clean_note}"
     header_line = f"## {request_id}"
 
+    with _NOTES_LOCK:
+        # Fast path: a plain append, no read-modify-write of the whole file.
+        before = _notes_stat_key()
+        if before is not None and _append_note_in_place(header_line, entry_line):
+            _extend_notes_cache(before, header_line, entry_line)
+            return {"timestamp": timestamp, "text": clean_note}
+        _rewrite_notes_with_entry(header_line, entry_line)
+    return {"timestamp": timestamp, "text": clean_note}
+
+
+def _rewrite_notes_with_entry(header_line: str, entry_line: str) -> None:
+    """Slow path for _append_note_for_request: insert the entry and rewrite the file."""
     lines = _ensure_notes_file()
 
     # Find or create the section for this requestId.
@@ -317,18 +538,13 @@ def _append_note_for_request(request_id: str, note: str) -> Dict[str, str]:
         lines.insert(insert_at, entry_line)
 
     NOTES_PATH.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
-    return {"timestamp": timestamp, "text": clean_note}
 
 
-def _read_notes() -> Dict[str, List[Dict[str, str]]]:
-    """
-    Parse 70_notes.md into a dict keyed by requestId.
-    """
-    if not NOTES_PATH.exists():
-        return {}
+def _parse_notes_lines(lines: Iterable[str]) -> Dict[str, List[Dict[str, str]]]:
+    """Group ``- <timestamp>: <text>`` bullets under their ``## <requestId>`` heading."""
     notes: Dict[str, List[Dict[str, str]]] = {}
     current_request: Optional[str] = None
-    for raw_line in NOTES_PATH.read_text(encoding="utf-8").splitlines():
+    for raw_line in lines:
         line = raw_line.strip()
         if line.startswith("## "):
             current_request = line[3:].strip()
@@ -343,10 +559,129 @@ def _read_notes() -> Dict[str, List[Dict[str, str]]]:
     return notes
 
 
+def _path_stat_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    """(path, mtime_ns, size) of a file, or None when it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _notes_stat_key() -> Optional[Tuple[str, int, int]]:
+    """(path, mtime_ns, size) of 70_notes.md, or None when it does not exist."""
+    return _path_stat_key(NOTES_PATH)
+
+
+def _extend_notes_cache(before: Optional[Tuple[str, int, int]], header_line: str, entry_line: str) -> None:
+    """
+    Write-through after an in-place append (caller holds _NOTES_LOCK).
+
+    If the cached index matched the file right before the append, adding the
+    one new entry keeps it current, so the next detail view does not reparse
+    the whole file. Lists are replaced rather than appended to because other
+    threads may still be serializing the old ones.
+    """
+    if before is None or _NOTES_CACHE["key"] != before:
+        return
+    index = dict(_NOTES_CACHE["index"])
+    added = _parse_notes_lines(io.StringIO(f"{header_line}\n{entry_line}\n", newline=None))
+    for request_id, entries in added.items():
+        index[request_id] = index.get(request_id, []) + entries
+    _NOTES_CACHE["key"] = _notes_stat_key()
+    _NOTES_CACHE["index"] = index
+
+
+@functools.lru_cache(maxsize=8)
+def _read_notes_tail_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Parse only the sections that start inside the last NOTES_TAIL_BYTES.
+
+    We seek near the end and skip forward to the first ``## `` heading, so a
+    section cut by the seek is dropped rather than returned half-read.
+    """
+    with open(path_str, "rb") as handle:
+        handle.seek(max(0, size - NOTES_TAIL_BYTES))
+        tail = handle.read()
+    boundary = tail.find(b"\n## ")
+    if boundary == -1:
+        return {}
+    # newline=None gives the same universal-newline splitting as open().
+    return _parse_notes_lines(io.StringIO(tail[boundary + 1 :].decode("utf-8"), newline=None))
+
+
+def _read_notes() -> Dict[str, List[Dict[str, str]]]:
+    """
+    Parse 70_notes.md into a dict keyed by requestId.
+
+    The parse is kept in _NOTES_CACHE until the file's (mtime, size) changes,
+    so repeated detail views cost one stat. Treat the result as read-only.
+    """
+    with _NOTES_LOCK:
+        key = _notes_stat_key()
+        if key is None:
+            return {}
+        if _NOTES_CACHE["key"] != key:
+            # Iterating the open file keeps this a single streaming pass.
+            with open(key[0], "r", encoding="utf-8") as handle:
+                _NOTES_CACHE["index"] = _parse_notes_lines(handle)
+            _NOTES_CACHE["key"] = key
+        return _NOTES_CACHE["index"]
+
+
 def _read_notes_for_request(request_id: str) -> List[Dict[str, str]]:
-    """Return stored notes for a specific requestId."""
-    all_notes = _read_notes()
-    return all_notes.get(request_id, [])
+    """
+    Return stored notes for a specific requestId.
+
+    A warm cache answers with a dict lookup. Otherwise, recently annotated
+    runs live at the end of the file, so large files try the tail first and
+    only fall back to a full parse when the requestId is not there.
+    Headings are unique (the writer appends to an existing section), so a
+    tail hit holds every note for that request.
+    """
+    key = _notes_stat_key()
+    if key is None:
+        return []
+    with _NOTES_LOCK:
+        if _NOTES_CACHE["key"] == key:
+            return _NOTES_CACHE["index"].get(request_id, [])
+    if key[2] > NOTES_TAIL_BYTES:
+        tail = _read_notes_tail_cached(*key)
+        if request_id in tail:
+            return tail[request_id]
+    return _read_notes().get(request_id, [])
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """
+    Append ``data`` to ``path`` with a raw O_APPEND descriptor.
+
+    Skipping Python's buffered wrapper means one ``write`` syscall per entry,
+    and O_APPEND makes the kernel place it at the current end of file even
+    when two handler threads enqueue at once.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _as_str_list(value: Any) -> Optional[List[str]]:
+    """
+    Validate and coerce a JSON array to ``List[str]`` in one pass, or None.
+
+    The UI always sends strings, so an all-string list is returned as-is
+    instead of being copied item by item.
+    """
+    if not isinstance(value, list):
+        return None
+    if all(type(item) is str for item in value):
+        return value
+    return [str(item) for item in value]
 
 
 def _enqueue_probe_plan(
@@ -372,53 +707,157 @@ def _enqueue_probe_plan(
         "createdAt": datetime.utcnow().isoformat() + "Z",
         "kind": "probePlanDraft",
     }
-    with PROBE_PLAN_QUEUE_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, ensure_ascii=False))
-        handle.write("\n")
+    _append_bytes(PROBE_PLAN_QUEUE_PATH, _json_dumps(entry) + b"\n")
     return entry
 
 
 def _load_probe_plans_for_request(request_id: str) -> List[Dict[str, Any]]:
     """
     Read any ProbePlan draft entries for this requestId from the review queue.
+
+    Most queue lines belong to other requests, so we only parse lines that
+    contain the JSON-encoded requestId. ``mm.find`` jumps straight between
+    candidates; the parsed ``requestId`` is still compared exactly, since the
+    needle may also appear inside a draft's text.
     """
     if not PROBE_PLAN_QUEUE_PATH.exists():
         return []
+    needle = _json_dumps(request_id)
     entries: List[Dict[str, Any]] = []
-    for line in PROBE_PLAN_QUEUE_PATH.read_text(encoding="utf-8").splitlines():
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if payload.get("requestId") == request_id:
-            entries.append(payload)
+    with PROBE_PLAN_QUEUE_PATH.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return entries
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            while pos != -1:
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end == -1:
+                    line_end = len(mm)
+                try:
+                    payload = _json_loads(mm[line_start:line_end])
+                except ValueError:
+                    payload = None
+                if isinstance(payload, dict) and payload.get("requestId") == request_id:
+                    entries.append(payload)
+                pos = mm.find(needle, line_end)
     return entries
 
 
-def _load_run_detail(date_bucket: str, request_id: str) -> Dict[str, Any]:
+# Bulky detail fields kept out of the API summary payload. The UI fetches them
+# one at a time from /dev/logs/api/run/<date>/<requestId>/file/<key>; for each
+# key the first non-empty file wins (requests may be 00_request.json in some
+# schemas, otherwise we fall back to the OpenAI request).
+_DETAIL_BLOB_FILES: Dict[str, Tuple[str, ...]] = {
+    "request": ("00_request.json", "06_openai_request.json"),
+    "responseMeta": ("21_openai_response_meta.json",),
+    "traceRaw": ("41_trace_raw.json",),
+    "traceSanitized": ("42_trace_sanitized.json",),
+    "traceFinal": ("43_trace_final.json",),
+    "sanitizeReasons": ("44_sanitize_reasons.json",),
+    "parsedOutput": ("30_parsed_output.json",),
+    "finalOutput": ("50_final_output.json",),
+}
+# Plain-text bundle files, served verbatim from the same /file/<key> route.
+# The system prompt can run to megabytes, so it stays out of the JSON detail
+# payload (no decode, JSON-escape and re-encode on the way out).
+_DETAIL_TEXT_FILES: Dict[str, str] = {"systemPrompt": "05_system_prompt.txt"}
+_PROBE_PLAN_KEYS = ("missingFields", "followUpQuestions")
+
+
+def _read_bundle_blob(files: Mapping[str, os.DirEntry], key: str) -> Dict[str, Any]:
+    """Read one ``_DETAIL_BLOB_FILES`` entry from a :func:`_scan_bundle_files` listing."""
+    payload: Dict[str, Any] = {}
+    for name in _DETAIL_BLOB_FILES[key]:
+        payload = _read_json_entry(files.get(name))
+        if payload:
+            break
+    return payload
+
+
+def _run_blob_entry(date_bucket: str, request_id: str, key: str) -> Optional[os.DirEntry]:
     """
-    Load all relevant files for a single bundle and derive UI-friendly slices.
+    The file :func:`_read_bundle_blob` would read ``key`` from, or None.
+
+    The raw-file endpoint sends this file's bytes as they are on disk; the
+    (cached) parse only decides which candidate is the non-empty one.
     """
-    run_path = LOG_ROOT / date_bucket / request_id
-    index_json = _read_json_if_exists(run_path / "index.json")
+    files = _scan_bundle_files(LOG_ROOT / date_bucket / request_id)
+    for name in _DETAIL_BLOB_FILES[key]:
+        entry = files.get(name)
+        if entry is not None and _read_json_entry(entry):
+            return entry
+    return None
+
+
+def _probe_plan_slice(payload: Any) -> Dict[str, Any]:
+    """Keep only the keys the client's ProbePlan draft reads (top level and finalOutput)."""
+    if not isinstance(payload, dict):
+        return {}
+    slim = {key: payload[key] for key in _PROBE_PLAN_KEYS if key in payload}
+    inner = payload.get("finalOutput")
+    if isinstance(inner, dict):
+        slim["finalOutput"] = {key: inner[key] for key in _PROBE_PLAN_KEYS if key in inner}
+    return slim
+
+
+def _run_detail_summary(detail: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop the bulky trace/output blobs from a detail payload.
+
+    Everything the tabs render is derived server-side, so the first paint
+    only needs this summary; tab sections and raw files load lazily.
+    """
+    summary = {
+        key: value for key, value in detail.items() if key not in _DETAIL_BLOB_FILES and key not in _DETAIL_TEXT_FILES
+    }
+    summary["probePlanSources"] = [
+        _probe_plan_slice(detail.get(key)) for key in ("finalOutput", "traceFinal", "parsedOutput")
+    ]
+    return summary
+
+
+def _run_detail_signature(files: Mapping[str, os.DirEntry]) -> Tuple[Any, ...]:
+    """
+    Everything a run detail is derived from: bundle files, notes and the queue.
+
+    Any append to 70_notes.md or the probe-plan queue changes its size, so a
+    note or draft saved from the detail view is never hidden by the cache.
+    """
+    file_keys = []
+    for name in sorted(files):
+        stat = files[name].stat()
+        file_keys.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(file_keys), _notes_stat_key(), _path_stat_key(PROBE_PLAN_QUEUE_PATH)
+
+
+def _run_detail_etag(date_bucket: str, request_id: str, signature: Tuple[Any, ...]) -> str:
+    """Strong ETag for a run detail, derived from its inputs rather than its body."""
+    digest = hashlib.sha256(repr((_ETAG_SALT, date_bucket, request_id, signature)).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _signature_last_modified(file_keys: Iterable[Optional[Tuple[Any, int, int]]]) -> Optional[int]:
+    """Newest mtime (whole seconds) among ``(name, mtime_ns, size)`` keys, or None if there are none."""
+    mtimes = [key[1] for key in file_keys if key is not None]
+    return max(mtimes) // 1_000_000_000 if mtimes else None
+
+
+def _run_detail_base(date_bucket: str, request_id: str, files: Mapping[str, os.DirEntry]) -> Dict[str, Any]:
+    """
+    Run detail fields every view needs: header meta, the Request tab, notes
+    and probe-plan inputs. Per-tab slices live in ``_RUN_DETAIL_SECTIONS``.
+    """
+    index_json = _read_json_entry(files.get("index.json"))
     # Request payload may be named 00_request.json in some schemas; fall back to openai request.
-    request_json = _read_json_if_exists(run_path / "00_request.json")
-    if not request_json:
-        request_json = _read_json_if_exists(run_path / "06_openai_request.json")
-    response_meta = _read_json_if_exists(run_path / "21_openai_response_meta.json")
-    trace_raw = _read_json_if_exists(run_path / "41_trace_raw.json")
-    trace_sanitized = _read_json_if_exists(run_path / "42_trace_sanitized.json")
-    trace_final = _read_json_if_exists(run_path / "43_trace_final.json")
-    sanitize_reasons = _read_json_if_exists(run_path / "44_sanitize_reasons.json")
-    parsed_output = _read_json_if_exists(run_path / "30_parsed_output.json")
-    final_output = _read_json_if_exists(run_path / "50_final_output.json")
-    system_prompt_text = _read_text_if_exists(run_path / "05_system_prompt.txt")
-
-    transcript = _extract_transcript(request_json, trace_final)
-    evidence_map = _extract_evidence_map(trace_final, sanitize_reasons)
-    assets = _extract_assets(request_json, final_output or trace_final)
-
-    missing_count = _compute_missing_count(trace_final, sanitize_reasons)
+    request_json = _read_bundle_blob(files, "request")
+    response_meta = _read_bundle_blob(files, "responseMeta")
+    trace_raw = _read_bundle_blob(files, "traceRaw")
+    trace_sanitized = _read_bundle_blob(files, "traceSanitized")
+    trace_final = _read_bundle_blob(files, "traceFinal")
+    sanitize_reasons = _read_bundle_blob(files, "sanitizeReasons")
+    parsed_output = _read_bundle_blob(files, "parsedOutput")
+    final_output = _read_bundle_blob(files, "finalOutput")
 
     return {
         "requestId": request_id,
@@ -432,74 +871,322 @@ def _load_run_detail(date_bucket: str, request_id: str) -> Dict[str, Any]:
         "sanitizeReasons": sanitize_reasons,
         "parsedOutput": parsed_output,
         "finalOutput": final_output,
-        "systemPrompt": system_prompt_text,
-        "transcript": transcript,
-        "evidenceMap": evidence_map,
-        "assets": assets,
-        "missingCount": missing_count,
-        "tokenCount": _token_count(response_meta),
+        # Pre-escaped <pre> body so the client can drop it in as-is.
+        "requestHtml": _safe_json_html(request_json or trace_raw),
+        "missingCount": missing_field_count(trace_final, sanitize_reasons),
+        "tokenCount": usage_token_count(response_meta),
         "tags": _extract_tags(request_json, index_json),
         "notes": _read_notes_for_request(request_id),
         "probePlanDrafts": _load_probe_plans_for_request(request_id),
     }
 
 
+def _transcript_section(files: Mapping[str, os.DirEntry]) -> Dict[str, Any]:
+    return {"transcript": _extract_transcript(_read_bundle_blob(files, "request"), _read_bundle_blob(files, "traceFinal"))}
+
+
+def _evidence_section(files: Mapping[str, os.DirEntry]) -> Dict[str, Any]:
+    trace_final = _read_bundle_blob(files, "traceFinal")
+    return {"evidenceMap": _extract_evidence_map(trace_final, _read_bundle_blob(files, "sanitizeReasons"))}
+
+
+def _assets_section(files: Mapping[str, os.DirEntry]) -> Dict[str, Any]:
+    final_output = _read_bundle_blob(files, "finalOutput")
+    assets = _extract_assets(_read_bundle_blob(files, "request"), final_output or _read_bundle_blob(files, "traceFinal"))
+    # Pre-escaped <pre> body, like requestHtml.
+    return {"assets": assets, "linkedAssetsHtml": _safe_json_html(assets["linkedAssets"] or [])}
+
+
+def _diff_section(files: Mapping[str, os.DirEntry]) -> Dict[str, Any]:
+    parsed_output = _read_bundle_blob(files, "parsedOutput")
+    final_output = _read_bundle_blob(files, "finalOutput")
+    diff = _diff_extraction(parsed_output, final_output) if parsed_output or final_output else ""
+    return {"diffExtraction": diff}
+
+
+# Derived detail slices served one tab at a time from
+# /dev/logs/api/run/<date>/<requestId>/<section>, so opening a run only pays
+# for the tab on screen. Each reads just the bundle files it names.
+_RUN_DETAIL_SECTIONS: Dict[str, Callable[[Mapping[str, os.DirEntry]], Dict[str, Any]]] = {
+    "transcript": _transcript_section,
+    "evidence": _evidence_section,
+    "assets": _assets_section,
+    "diff": _diff_section,
+}
+
+
+def _structural_diff(old: Any, new: Any, path: str = "") -> Iterator[Tuple[str, str, Any, Any]]:
+    """
+    Yield ``(op, path, old, new)`` for every leaf that differs between two JSON trees.
+
+    ``op`` is ``"-"`` (only in ``old``), ``"+"`` (only in ``new``) or ``"~"``
+    (changed). Dict keys are visited in sorted order; lists are compared by
+    index. One walk over both trees, instead of diffing two pretty-printed
+    dumps line by line.
+    """
+    if old is new:
+        return
+    if type(old) is dict and type(new) is dict:
+        for key in sorted(old.keys() | new.keys()):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in new:
+                yield "-", child, old[key], None
+            elif key not in old:
+                yield "+", child, None, new[key]
+            else:
+                yield from _structural_diff(old[key], new[key], child)
+        return
+    if type(old) is list and type(new) is list:
+        for idx in range(max(len(old), len(new))):
+            child = f"{path}[{idx}]"
+            if idx >= len(new):
+                yield "-", child, old[idx], None
+            elif idx >= len(old):
+                yield "+", child, None, new[idx]
+            else:
+                yield from _structural_diff(old[idx], new[idx], child)
+        return
+    # type() check too, so 1 -> true or 1 -> 1.0 still shows up as a change.
+    if type(old) is not type(new) or old != new:
+        yield "~", path, old, new
+
+
 def _diff_extraction(parsed_output: Dict[str, Any], final_output: Dict[str, Any]) -> str:
     """
     Produce a small JSON diff string between parsed and final extractionTrace.
+
+    Each changed path gets a unified-diff style hunk (``@@ path @@`` then
+    ``-old`` / ``+new`` as compact JSON). Identical traces give "".
     """
-    import difflib
+    lines: List[str] = []
+    changes = _structural_diff(parsed_output.get("extractionTrace", {}), final_output.get("extractionTrace", {}))
+    for op, path, old, new in changes:
+        lines.append(f"@@ {path or '(root)'} @@")
+        if op != "+":
+            lines.append("-" + _json_dumps(old, sort_keys=True).decode("utf-8"))
+        if op != "-":
+            lines.append("+" + _json_dumps(new, sort_keys=True).decode("utf-8"))
+    if not lines:
+        return ""
+    return "\n".join(["--- 30_parsed_output", "+++ 50_final_output", *lines])
 
-    parsed_trace = json.dumps(parsed_output.get("extractionTrace", {}), ensure_ascii=False, indent=2, sort_keys=True)
-    final_trace = json.dumps(final_output.get("extractionTrace", {}), ensure_ascii=False, indent=2, sort_keys=True)
-    diff_lines = difflib.unified_diff(
-        parsed_trace.splitlines(), final_trace.splitlines(), fromfile="30_parsed_output", tofile="50_final_output"
-    )
-    return "\n".join(diff_lines)
+
+@functools.lru_cache(maxsize=64)
+def _run_detail_body(date_bucket: str, request_id: str, signature: Tuple[Any, ...]) -> bytes:
+    """
+    Encoded :func:`_run_detail_summary` of :func:`_run_detail_base` for the
+    detail endpoint, cached on the run's signature.
+
+    A browser without a cached copy of an unchanged run therefore costs no
+    parsing, deriving or encoding, and the per-tab sections are not derived
+    at all until a tab asks for them.
+    """
+    files = _scan_bundle_files(LOG_ROOT / date_bucket / request_id)
+    return _json_dumps(_run_detail_summary(_run_detail_base(date_bucket, request_id, files)))
+
+
+@functools.lru_cache(maxsize=256)
+def _run_section_body(date_bucket: str, request_id: str, section: str, _file_keys: Tuple[Any, ...]) -> bytes:
+    """Encoded ``_RUN_DETAIL_SECTIONS[section]``, cached on the bundle files' stats."""
+    files = _scan_bundle_files(LOG_ROOT / date_bucket / request_id)
+    return _json_dumps(_RUN_DETAIL_SECTIONS[section](files))
+
+
+# Files a list-view entry is derived from, relative to the bundle folder.
+_INVENTORY_FILES = (
+    "index.json",
+    "43_trace_final.json",
+    "44_sanitize_reasons.json",
+    "21_openai_response_meta.json",
+    "00_request.json",
+)
+
+
+def _load_inventory_entry(date_bucket: str, run_path: Path) -> Dict[str, Any]:
+    """
+    Summarize one bundle for the list view (runs on an inventory worker thread).
+
+    Entries are memoized on the stat of every file they read, so a rebuild
+    only re-derives bundles that actually changed.
+    """
+    # Joined as strings: this runs per file per bundle, and each ``Path /``
+    # would parse a new path object. Same spelling as str(run_path / name),
+    # so the parse cache keys agree with the detail view's DirEntry paths.
+    base = os.fspath(run_path) + os.sep
+    stats: List[Optional[Tuple[int, int]]] = []
+    for name in _INVENTORY_FILES:
+        try:
+            stat = os.stat(base + name)
+        except FileNotFoundError:
+            stats.append(None)
+        else:
+            stats.append((stat.st_mtime_ns, stat.st_size))
+    return _inventory_entry_cached(date_bucket, run_path, tuple(stats))
+
+
+@functools.lru_cache(maxsize=4096)
+def _inventory_entry_cached(date_bucket: str, run_path: Path, stats: Tuple[Any, ...]) -> Dict[str, Any]:
+    # The shared entry must not be mutated. ``stats`` lines up with
+    # _INVENTORY_FILES, so files are read without being stat'ed a second time.
+    request_id = run_path.name
+    base = os.fspath(run_path) + os.sep
+    stat_by_name = dict(zip(_INVENTORY_FILES, stats))
+
+    def read(name: str) -> Any:
+        stat = stat_by_name[name]
+        if stat is None:
+            return {}
+        return _read_json_cached(base + name, *stat)
+
+    # Normalize once so every field below is a plain .get (a non-object
+    # index.json reads like an empty one).
+    index_json = read("index.json")
+    if type(index_json) is not dict:
+        index_json = {}
+    summary = index_json.get("inventory")
+    if type(summary) is dict and "missingCount" in summary and "tokenCount" in summary:
+        # Written by postcall_trace alongside the bundle: skip the three trace reads.
+        missing = summary["missingCount"]
+        tokens = summary["tokenCount"]
+    else:
+        # Older bundles (or other writers) carry no summary; derive it.
+        final_trace = read("43_trace_final.json")
+        sanitize_reasons = read("44_sanitize_reasons.json")
+        response_meta = read("21_openai_response_meta.json")
+        missing = missing_field_count(final_trace, sanitize_reasons)
+        tokens = usage_token_count(response_meta)
+
+    return {
+        "requestId": request_id,
+        "dateBucket": date_bucket,
+        "createdAt": index_json.get("createdAt"),
+        "promptVersion": index_json.get("promptVersion"),
+        "schemaVersion": index_json.get("schemaVersion"),
+        "missingCount": missing,
+        "tokenCount": tokens,
+        "tags": _extract_tags(read("00_request.json"), index_json),
+        "path": f"/dev/logs/{date_bucket}/{request_id}",
+        # durationMs is not present in the sample schema; keep slot for future data.
+        "durationMs": index_json.get("durationMs"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _inventory_pool() -> ThreadPoolExecutor:
+    """
+    Process-wide pool for inventory loads, created on first use.
+
+    Sharing one pool means list refreshes reuse warm threads instead of
+    spawning and joining up to INVENTORY_MAX_WORKERS of them per request.
+    """
+    return ThreadPoolExecutor(max_workers=INVENTORY_MAX_WORKERS, thread_name_prefix="inventory")
+
+
+def _iter_runs_inventory() -> Iterator[Dict[str, Any]]:
+    """
+    Yield list-view entries in walk order, each as soon as it has loaded.
+
+    Bundles are independent and mostly wait on disk, so they load on the
+    shared inventory pool. ``executor.map`` keeps the results in walk order.
+    """
+    bundles = _gather_bundle_paths()
+    if len(bundles) < INVENTORY_POOL_MIN_BUNDLES:
+        for date_bucket, run_path in bundles:
+            yield _load_inventory_entry(date_bucket, run_path)
+        return
+    yield from _inventory_pool().map(_load_inventory_entry, *zip(*bundles))
 
 
 def _build_runs_inventory() -> List[Dict[str, Any]]:
+    """Collect high-level metadata for the list view filters."""
+    return list(_iter_runs_inventory())
+
+
+def _fresh_runs_cache(signature: Any, now: float) -> Optional[Tuple[Any, float, List[Dict[str, Any]], bytes, str]]:
+    """The cached inventory entry if it is still valid for ``signature``, else None."""
+    cached = _RUNS_CACHE
+    if cached is not None and cached[0] == signature and now - cached[1] < RUNS_CACHE_TTL_SECONDS:
+        return cached
+    return None
+
+
+def _store_runs_cache(
+    signature: Any, now: float, runs: List[Dict[str, Any]]
+) -> Tuple[Any, float, List[Dict[str, Any]], bytes, str]:
+    """Encode ``runs``, fingerprint the body and publish it as the cache entry."""
+    global _RUNS_CACHE
+    body = _json_dumps({"runs": runs})
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    # One tuple assignment, so concurrent handlers never see a mixed entry.
+    _RUNS_CACHE = (signature, now, runs, body, etag)
+    return _RUNS_CACHE
+
+
+def _runs_inventory_entry() -> Tuple[Any, float, List[Dict[str, Any]], bytes, str]:
     """
-    Collect high-level metadata for the list view filters.
-    """
-    runs: List[Dict[str, Any]] = []
-    for date_bucket, run_path in _gather_bundle_paths():
-        request_id = run_path.name
-        index_json = _read_json_if_exists(run_path / "index.json")
-        final_trace = _read_json_if_exists(run_path / "43_trace_final.json")
-        sanitize_reasons = _read_json_if_exists(run_path / "44_sanitize_reasons.json")
-        response_meta = _read_json_if_exists(run_path / "21_openai_response_meta.json")
-
-        missing = _compute_missing_count(final_trace, sanitize_reasons)
-        tokens = _token_count(response_meta)
-        tags = _extract_tags(_read_json_if_exists(run_path / "00_request.json"), index_json)
-        created_at = index_json.get("createdAt") if isinstance(index_json, dict) else None
-
-        runs.append(
-            {
-                "requestId": request_id,
-                "dateBucket": date_bucket,
-                "createdAt": created_at,
-                "promptVersion": index_json.get("promptVersion") if isinstance(index_json, dict) else None,
-                "schemaVersion": index_json.get("schemaVersion") if isinstance(index_json, dict) else None,
-                "missingCount": missing,
-                "tokenCount": tokens,
-                "tags": tags,
-                "path": f"/dev/logs/{date_bucket}/{request_id}",
-                # durationMs is not present in the sample schema; keep slot for future data.
-                "durationMs": index_json.get("durationMs") if isinstance(index_json, dict) else None,
-            }
-        )
-    return runs
+    (signature, built at, runs, encoded body, ETag) for the list view.
+
+    A cached inventory is served while the tree signature is unchanged and it
+    is younger than RUNS_CACHE_TTL_SECONDS. The TTL bounds how long a bundle
+    that was still being written when we listed it can look incomplete. The
+    ETag hashes the encoded body, so a rebuild that finds nothing new still
+    lets the browser keep its copy.
+    """
+    signature = _bundle_tree_signature()
+    now = time.monotonic()
+    return _fresh_runs_cache(signature, now) or _store_runs_cache(signature, now, _build_runs_inventory())
 
 
-def _html_shell() -> str:
+def _stream_runs_inventory() -> Iterator[Dict[str, Any]]:
     """
-    Return the single-page HTML (vanilla JS) used for both list and detail views.
-    The JS detects whether the path looks like /dev/logs/<date>/<id> and fetches
-    the appropriate API endpoint.
+    :func:`_runs_inventory_entry` for the NDJSON list endpoint.
+
+    A valid cache entry is replayed; otherwise entries are yielded while the
+    pool is still loading later bundles, and the finished list is cached.
+    """
+    signature = _bundle_tree_signature()
+    now = time.monotonic()
+    cached = _fresh_runs_cache(signature, now)
+    if cached is not None:
+        yield from cached[2]
+        return
+    runs = []
+    for run in _iter_runs_inventory():
+        runs.append(run)
+        yield run
+    _store_runs_cache(signature, now, runs)
+
+
+def _run_filter(params: Mapping[str, List[str]]) -> Optional[Callable[[Dict[str, Any]], bool]]:
     """
-    return r"""
+    Build the list-view filter from ``missing``/``duration``/``tokens``/``tag``.
+
+    Mirrors the filters the list view used to apply in the browser: numeric
+    fields must be strictly greater than the given minimum (absent values
+    count as 0) and ``tag`` is a case-insensitive substring of any tag.
+    Returns None when no filter parameter is present; raises ValueError on
+    non-numeric minimums.
+    """
+    if not any(key in params for key in ("missing", "duration", "tokens", "tag")):
+        return None
+    missing_min = float(params.get("missing", ["-inf"])[0])
+    duration_min = float(params.get("duration", ["-inf"])[0])
+    tokens_min = float(params.get("tokens", ["-inf"])[0])
+    tag_text = params.get("tag", [""])[0].lower()
+
+    def keep(run: Dict[str, Any]) -> bool:
+        return (
+            run["missingCount"] > missing_min
+            and (run["durationMs"] or 0) > duration_min
+            and (run["tokenCount"] or 0) > tokens_min
+            and (not tag_text or any(tag_text in str(tag).lower() for tag in run["tags"]))
+        )
+
+    return keep
+
+
+# Single-page HTML (vanilla JS) shared by the list and detail views.
+_HTML_SHELL = r"""
 <!doctype html>
 <html lang="en">
   <head>
@@ -585,7 +1272,27 @@ def _html_shell() -> str:
       const pathParts = window.location.pathname.split('/').filter(Boolean);
       const isDetail = pathParts.length >= 4 && pathParts[0] === 'dev' && pathParts[1] === 'logs';
 
-      function renderList(runs) {
+      // Escapes text for innerHTML in a single regex pass over the string.
+      const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+      const HTML_ESCAPE_RE = /[&<>"]/g;
+      function escapeHtml(text) {
+        return String(text).replace(HTML_ESCAPE_RE, (ch) => HTML_ESCAPES[ch]);
+      }
+
+      // POST bodies are encoded to UTF-8 up front (one shared encoder), so
+      // fetch sends the bytes as-is instead of converting a string body.
+      const utf8 = new TextEncoder();
+      function postJson(url, payload) {
+        return fetch(url, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: utf8.encode(JSON.stringify(payload)),
+        });
+      }
+
+      // Rows for the current filters, streamed from the server as NDJSON; a
+      // filter change cancels the previous stream so only the newest one draws.
+      function renderList() {
         const view = document.getElementById('list-view').content.cloneNode(true);
         const body = view.querySelector('#runs-body');
         const filters = {
@@ -595,116 +1302,262 @@ def _html_shell() -> str:
           tag: view.querySelector('#filter-tag'),
         };
 
-        function applyFilters() {
-          const missingMin = Number(filters.missing.value || 0);
-          const durationMin = Number(filters.duration.value || 0);
-          const tokensMin = Number(filters.tokens.value || 0);
-          const tagText = filters.tag.value.toLowerCase();
-          body.innerHTML = '';
-          runs
-            .filter((run) => run.missingCount > missingMin)
-            .filter((run) => (run.durationMs || 0) > durationMin)
-            .filter((run) => (run.tokenCount || 0) > tokensMin)
-            .filter((run) => {
-              if (!tagText) return true;
-              return (run.tags || []).some((t) => String(t).toLowerCase().includes(tagText));
-            })
-            .forEach((run) => {
-              const tr = document.createElement('tr');
-              const tags = (run.tags || []).map((t) => `<span class=\"pill\">${t}</span>`).join(' ');
-              tr.innerHTML = `
-                <td><a href=\"${run.path}\"><strong>${run.requestId}</strong></a><div class=\"small mono\">${run.path}</div></td>
-                <td>${run.createdAt || ''}</td>
-                <td>${run.promptVersion || ''}</td>
-                <td>${run.missingCount}</td>
-                <td>${run.tokenCount ?? ''}</td>
-                <td>${tags}</td>
-              `;
-              body.appendChild(tr);
+        function filterQuery() {
+          // Filtering happens server-side on the cached inventory (see _run_filter).
+          const query = new URLSearchParams({
+            missing: filters.missing.value || 0,
+            duration: filters.duration.value || 0,
+            tokens: filters.tokens.value || 0,
+          });
+          if (filters.tag.value) query.set('tag', filters.tag.value);
+          return query;
+        }
+
+        function appendRows(rows) {
+          // Nodes and textContent rather than innerHTML: no HTML parse per
+          // row, and bundle text can never be interpreted as markup.
+          const frag = document.createDocumentFragment();
+          rows.forEach((run) => {
+            const tr = document.createElement('tr');
+            const first = document.createElement('td');
+            const link = document.createElement('a');
+            link.href = run.path;
+            const strong = document.createElement('strong');
+            strong.textContent = run.requestId;
+            link.appendChild(strong);
+            const pathLine = document.createElement('div');
+            pathLine.className = 'small mono';
+            pathLine.textContent = run.path;
+            first.append(link, pathLine);
+            tr.appendChild(first);
+            appendCells(tr, [run.createdAt || '', run.promptVersion || '', run.missingCount, run.tokenCount ?? '']);
+            const tagCell = document.createElement('td');
+            (run.tags || []).forEach((tag, idx) => {
+              if (idx) tagCell.append(' ');
+              const pill = document.createElement('span');
+              pill.className = 'pill';
+              pill.textContent = tag;
+              tagCell.appendChild(pill);
             });
+            tr.appendChild(tagCell);
+            frag.appendChild(tr);
+          });
+          body.appendChild(frag);
+        }
+
+        let generation = 0;
+        async function refresh() {
+          const current = ++generation;
+          const query = filterQuery();
+          query.set('format', 'ndjson');
+          const res = await fetch(`/dev/logs/api/runs?${query}`);
+          if (current !== generation) return;
+          body.innerHTML = '';
+          if (!res.ok || !res.body) {
+            query.delete('format');
+            const fallback = await fetch(`/dev/logs/api/runs?${query}`);
+            const payload = await fallback.json();
+            if (current === generation) appendRows(payload.runs || []);
+            return;
+          }
+          // NDJSON: rows render as each network chunk arrives instead of after the full scan.
+          const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+          let pending = '';
+          for (;;) {
+            const { value, done } = await reader.read();
+            if (current !== generation) {
+              reader.cancel();
+              return;
+            }
+            if (done) break;
+            const lines = (pending + value).split('\n');
+            pending = lines.pop();
+            const rows = lines.filter(Boolean).map((line) => JSON.parse(line));
+            if (rows.length) appendRows(rows);
+          }
+          if (pending.trim()) appendRows([JSON.parse(pending)]);
         }
 
-        Object.values(filters).forEach((input) => input.addEventListener('input', applyFilters));
-        applyFilters();
+        // Refetch once typing pauses rather than on every keystroke.
+        let filterTimer = 0;
+        Object.values(filters).forEach((input) =>
+          input.addEventListener('input', () => {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(refresh, 150);
+          })
+        );
         app.innerHTML = '';
         app.appendChild(view);
+        return refresh();
+      }
+
+      // Appends one <td> per value, as text.
+      function appendCells(tr, values) {
+        values.forEach((value) => {
+          const td = document.createElement('td');
+          td.textContent = value;
+          tr.appendChild(td);
+        });
+      }
+
+      // A <table> with a static header row; rows are filled in by the caller.
+      function createTable(headers) {
+        const table = document.createElement('table');
+        const headRow = table.createTHead().insertRow();
+        headers.forEach((label) => {
+          const th = document.createElement('th');
+          th.textContent = label;
+          headRow.appendChild(th);
+        });
+        return table;
       }
 
       function renderTranscript(transcript) {
         if (!transcript?.length) return '<div class=\"small\">No transcript found.</div>';
-        const rows = transcript
-          .map(
-            (turn) => `
-              <tr id=\"turn-${turn.idx}\" class=\"transcript-row\">
-                <td class=\"mono\">#${turn.idx}</td>
-                <td>${turn.speaker}</td>
-                <td>${turn.text}</td>
-              </tr>
-            `
-          )
-          .join('');
-        return `<table><thead><tr><th>#</th><th>Speaker</th><th>Text</th></tr></thead><tbody>${rows}</tbody></table>`;
+        const table = createTable(['#', 'Speaker', 'Text']);
+        const tbody = table.createTBody();
+        transcript.forEach((turn) => {
+          const tr = document.createElement('tr');
+          tr.id = `turn-${turn.idx}`;
+          tr.className = 'transcript-row';
+          appendCells(tr, [`#${turn.idx}`, turn.speaker, turn.text]);
+          tr.firstChild.className = 'mono';
+          tbody.appendChild(tr);
+        });
+        return table;
       }
 
-      function renderEvidence(evidence, transcript) {
+      function renderEvidence(evidence) {
         if (!evidence?.length) return '<div class=\"small\">No evidence map available.</div>';
-        const rows = evidence
-          .map((row) => {
-            const targetId = row.turnIndex != null ? `turn-${row.turnIndex}` : null;
-            return `
-              <tr data-target=\"${targetId || ''}\" class=\"evidence-row\">
-                <td class=\"mono\">${row.field}</td>
-                <td>${row.status || ''}</td>
-                <td>${row.turnIndex ?? ''}</td>
-                <td>${row.snippet || row.value || ''}</td>
-                <td>${row.reason || ''}</td>
-              </tr>
-            `;
-          })
-          .join('');
-        const table = document.createElement('div');
-        table.innerHTML = `<table><thead><tr><th>Field</th><th>Status</th><th>Turn</th><th>Snippet / Value</th><th>Reason</th></tr></thead><tbody>${rows}</tbody></table>`;
-        table.querySelectorAll('.evidence-row').forEach((row) => {
-          const target = row.dataset.target;
+        const table = createTable(['Field', 'Status', 'Turn', 'Snippet / Value', 'Reason']);
+        const tbody = table.createTBody();
+        evidence.forEach((row) => {
+          const tr = document.createElement('tr');
+          tr.className = 'evidence-row';
+          if (row.turnIndex != null) {
+            tr.dataset.target = `turn-${row.turnIndex}`;
+            tr.style.cursor = 'pointer';
+          }
+          appendCells(tr, [row.field, row.status || '', row.turnIndex ?? '', row.snippet || row.value || '', row.reason || '']);
+          tr.firstChild.className = 'mono';
+          tbody.appendChild(tr);
+        });
+        // One delegated listener jumps to the cited transcript turn (when that tab has loaded).
+        tbody.addEventListener('click', (event) => {
+          const row = event.target instanceof Element ? event.target.closest('.evidence-row') : null;
+          const target = row && row.dataset.target;
           if (!target) return;
-          row.style.cursor = 'pointer';
-          row.addEventListener('click', () => {
-            document.querySelectorAll('.transcript-row').forEach((tr) => tr.classList.remove('highlight'));
-            const el = document.getElementById(target);
-            if (el) {
-              el.classList.add('highlight');
-              el.scrollIntoView({ behavior: 'smooth', block: 'center' });
-            }
-          });
+          document.querySelectorAll('.transcript-row').forEach((tr) => tr.classList.remove('highlight'));
+          const el = document.getElementById(target);
+          if (el) {
+            el.classList.add('highlight');
+            el.scrollIntoView({ behavior: 'smooth', block: 'center' });
+          }
         });
-        return table.innerHTML;
+        return table;
       }
 
-      function renderAssets(assets) {
+      function renderAssets(assets, linkedAssetsHtml) {
         return `
           <div class=\"grid\">
             <div class=\"callout\"><strong>Asset Hints (input)</strong><div>${assets.assetHintsSummary || '—'}</div></div>
-            <div class=\"callout\"><strong>Linked Assets (output)</strong><pre>${JSON.stringify(assets.linkedAssets || [], null, 2)}</pre></div>
+            <div class=\"callout\"><strong>Linked Assets (output)</strong><pre>${linkedAssetsHtml || '[]'}</pre></div>
           </div>
         `;
       }
 
+      const RAW_FILE_KEYS = ['traceRaw', 'traceSanitized', 'traceFinal', 'sanitizeReasons', 'parsedOutput', 'finalOutput', 'responseMeta', 'request'];
+
+      function renderRawFilesTab() {
+        const options = RAW_FILE_KEYS.map((key) => `<option value=\"${key}\">${key}</option>`).join('');
+        return `
+          <div class=\"meta-actions\" style=\"margin-bottom:8px;\">
+            <select id=\"raw-file-key\">${options}</select>
+            <span id=\"raw-file-status\" class=\"small muted\">Loaded on demand.</span>
+          </div>
+          <pre id=\"raw-file-output\" class=\"mono\"></pre>
+        `;
+      }
+
+      // Appends a text response to ``output`` chunk by chunk as it arrives, so a
+      // multi-MB file paints progressively and is never escaped or parsed as
+      // HTML. Resolves to the whole text, or null once ``isCurrent()`` is false.
+      async function streamText(res, output, isCurrent) {
+        const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+        const parts = [];
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (!isCurrent()) {
+            reader.cancel();
+            return null;
+          }
+          if (done) break;
+          parts.push(value);
+          output.appendChild(document.createTextNode(value));
+        }
+        return parts.join('');
+      }
+
+      // The system prompt is a plain-text file, fetched next to the detail
+      // payload instead of inside it.
+      async function loadSystemPrompt(output, dateBucket, requestId) {
+        if (!output) return;
+        const res = await fetch(`/dev/logs/api/run/${dateBucket}/${requestId}/file/systemPrompt`);
+        if (!res.ok || !res.body) return;
+        await streamText(res, output, () => output.isConnected);
+      }
+
+      function bindRawFiles(root, dateBucket, requestId) {
+        const select = root.querySelector('#raw-file-key');
+        const output = root.querySelector('#raw-file-output');
+        const status = root.querySelector('#raw-file-status');
+        const loaded = new Map();
+        if (!select || !output) return () => {};
+        let generation = 0;
+
+        async function load() {
+          const key = select.value;
+          const current = ++generation;
+          if (loaded.has(key)) {
+            output.textContent = loaded.get(key);
+            if (status) status.textContent = `${key} (fetched once, cached for this page).`;
+            return;
+          }
+          if (status) status.textContent = `Loading ${key}...`;
+          output.textContent = '';
+          const res = await fetch(`/dev/logs/api/run/${dateBucket}/${requestId}/file/${key}`);
+          if (current !== generation) return;
+          if (!res.ok || !res.body) {
+            output.textContent = 'Unavailable.';
+            return;
+          }
+          // The server sends the file as written (already pretty-printed), so it is shown verbatim.
+          const text = await streamText(res, output, () => current === generation);
+          if (text === null) return;
+          loaded.set(key, text);
+          if (status) status.textContent = `${key} (fetched once, cached for this page).`;
+        }
+
+        select.addEventListener('change', load);
+        return load;
+      }
+
       function renderDiff(diffText) {
         if (!diffText) return '<div class=\"small\">No diff available.</div>';
-        return `<pre class=\"mono\">${diffText.replace(/</g, '&lt;')}</pre>`;
+        return `<pre class=\"mono\">${escapeHtml(diffText)}</pre>`;
       }
 
       function renderRequestTab(data) {
-        const payload = data.request && Object.keys(data.request).length ? data.request : data.traceRaw;
+        // requestHtml is pretty-printed and escaped server-side (request payload, or traceRaw as fallback).
         return `
           <div class=\"grid\">
             <div>
               <div class=\"small\">System Prompt</div>
-              <pre>${(data.systemPrompt || '').replace(/</g, '&lt;')}</pre>
+              <pre id=\"system-prompt\"></pre>
             </div>
             <div>
               <div class=\"small\">Request Payload</div>
-              <pre>${JSON.stringify(payload || {}, null, 2).replace(/</g, '&lt;')}</pre>
+              <pre>${data.requestHtml || '{}'}</pre>
             </div>
           </div>
         `;
@@ -724,24 +1577,29 @@ def _html_shell() -> str:
           .join('');
       }
 
-      function collectArray(payload, key) {
-        const values = [];
-        if (!payload || typeof payload !== 'object') return values;
-        if (Array.isArray(payload[key])) values.push(...payload[key]);
-        if (payload.finalOutput && Array.isArray(payload.finalOutput[key])) values.push(...payload.finalOutput[key]);
-        return values;
+      function addValues(target, values) {
+        if (!Array.isArray(values)) return;
+        for (const value of values) {
+          if (value) target.add(String(value));
+        }
       }
 
       function extractProbePlanInputs(data) {
-        const sources = [data.finalOutput, data.traceFinal, data.parsedOutput];
-        const missingFields = [];
-        const followUpQuestions = [];
-        sources.forEach((payload) => {
-          missingFields.push(...collectArray(payload, 'missingFields'));
-          followUpQuestions.push(...collectArray(payload, 'followUpQuestions'));
-        });
-        const dedupe = (arr) => Array.from(new Set(arr.filter(Boolean).map((item) => String(item))));
-        return { missingFields: dedupe(missingFields), followUpQuestions: dedupe(followUpQuestions) };
+        // Server-trimmed copies of finalOutput / traceFinal / parsedOutput, in that order.
+        // Sets dedupe as we go and keep first-seen order, so there is one pass per array.
+        const missingFields = new Set();
+        const followUpQuestions = new Set();
+        for (const payload of data.probePlanSources || []) {
+          if (!payload || typeof payload !== 'object') continue;
+          addValues(missingFields, payload.missingFields);
+          addValues(followUpQuestions, payload.followUpQuestions);
+          const inner = payload.finalOutput;
+          if (inner) {
+            addValues(missingFields, inner.missingFields);
+            addValues(followUpQuestions, inner.followUpQuestions);
+          }
+        }
+        return { missingFields: [...missingFields], followUpQuestions: [...followUpQuestions] };
       }
 
       function buildProbePlanDraft(data) {
@@ -779,10 +1637,19 @@ def _html_shell() -> str:
         localStorage.setItem(`probePlanDraft:${requestId}`, JSON.stringify(draft));
       }
 
+      // Last rendered preview. Drafts arrive as fresh objects (JSON.parse, the
+      // server echo), so the cache is keyed on the text rather than identity;
+      // re-rendering an unchanged draft skips the escape.
+      const probePreviewCache = { text: null, html: '' };
+
       function renderProbePreview(draft) {
         if (!draft) return '<div class=\"small muted\">No ProbePlan draft yet. Click “ProbePlan下書きを作る”.</div>';
         const summary = draft.draftText || '';
-        return `<pre class=\"mono\" style=\"max-height:220px; overflow:auto; white-space:pre-wrap;\">${summary.replace(/</g, '&lt;')}</pre>`;
+        if (probePreviewCache.text !== summary) {
+          probePreviewCache.text = summary;
+          probePreviewCache.html = `<pre class=\"mono\" style=\"max-height:220px; overflow:auto; white-space:pre-wrap;\">${escapeHtml(summary)}</pre>`;
+        }
+        return probePreviewCache.html;
       }
 
       function bindNotes(root, data, requestId) {
@@ -796,11 +1663,25 @@ def _html_shell() -> str:
         const cachedDraft = localStorage.getItem(draftKey);
         if (cachedDraft) noteInput.value = cachedDraft;
 
-        noteHistory.innerHTML = renderNoteHistory(data.notes);
-
-        noteInput.addEventListener('input', () => {
+        // The saved history was rendered by renderMeta; only saves redraw it.
+
+        // localStorage writes are synchronous, so keystrokes are coalesced into
+        // one write ~250ms after typing pauses, run when the browser is idle.
+        const whenIdle = window.requestIdleCallback || ((fn) => setTimeout(fn, 0));
+        let draftTimer = 0;
+        let draftDirty = false;
+        const flushDraft = () => {
+          clearTimeout(draftTimer);
+          if (!draftDirty) return;
+          draftDirty = false;
           localStorage.setItem(draftKey, noteInput.value);
+        };
+        noteInput.addEventListener('input', () => {
+          draftDirty = true;
+          clearTimeout(draftTimer);
+          draftTimer = setTimeout(() => whenIdle(flushDraft), 250);
         });
+        noteInput.addEventListener('blur', flushDraft);
 
         noteButton.addEventListener('click', async () => {
           const note = noteInput.value.trim();
@@ -811,15 +1692,14 @@ def _html_shell() -> str:
           noteButton.disabled = true;
           noteStatus.textContent = 'Saving to 70_notes.md...';
           try {
-            const res = await fetch('/dev/logs/api/note', {
-              method: 'POST',
-              headers: { 'Content-Type': 'application/json' },
-              body: JSON.stringify({ requestId, note }),
-            });
+            const res = await postJson('/dev/logs/api/note', { requestId, note });
             if (!res.ok) throw new Error('save failed');
             const payload = await res.json();
             noteHistory.innerHTML = renderNoteHistory(payload.notes);
             noteStatus.textContent = 'Saved to 70_notes.md (dev-only).';
+            // Drop any pending debounced write so it cannot resurrect the draft.
+            draftDirty = false;
+            clearTimeout(draftTimer);
             localStorage.removeItem(draftKey);
             noteInput.value = '';
           } catch (error) {
@@ -835,14 +1715,7 @@ def _html_shell() -> str:
         const status = root.querySelector('#probe-plan-status');
         const buildBtn = root.querySelector('#probe-plan-btn');
         const saveBtn = root.querySelector('#save-probe-plan');
-
-        const serverDrafts = Array.isArray(data.probePlanDrafts) ? data.probePlanDrafts : [];
-        const latestServer = serverDrafts[serverDrafts.length - 1] || null;
-        const initialDraft = loadLocalProbePlan(requestId) || latestServer;
-
-        if (preview) {
-          preview.innerHTML = renderProbePreview(initialDraft);
-        }
+        // renderMeta already drew the initial draft (see initialProbeDraft).
 
         const buildDraft = () => {
           const draft = buildProbePlanDraft(data);
@@ -864,17 +1737,13 @@ def _html_shell() -> str:
             saveBtn.disabled = true;
             if (status) status.textContent = 'Queueing draft to review...';
             try {
-              const res = await fetch('/dev/logs/api/probe-plan', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                  requestId,
-                  dateBucket,
-                  draftText: draft.draftText,
-                  missingFields: draft.missingFields,
-                  followUpQuestions: draft.followUpQuestions,
-                  tags: data.tags || [],
-                }),
+              const res = await postJson('/dev/logs/api/probe-plan', {
+                requestId,
+                dateBucket,
+                draftText: draft.draftText,
+                missingFields: draft.missingFields,
+                followUpQuestions: draft.followUpQuestions,
+                tags: data.tags || [],
               });
               if (!res.ok) throw new Error('queue failed');
               const payload = await res.json();
@@ -892,9 +1761,13 @@ def _html_shell() -> str:
         }
       }
 
+      function initialProbeDraft(data) {
+        // A local draft (built or queued in this browser) wins over the latest queued one.
+        const serverDrafts = Array.isArray(data.probePlanDrafts) ? data.probePlanDrafts : [];
+        return loadLocalProbePlan(data.requestId) || serverDrafts[serverDrafts.length - 1] || null;
+      }
+
       function renderMeta(data) {
-        const probeDrafts = Array.isArray(data.probePlanDrafts) ? data.probePlanDrafts : [];
-        const latestServerDraft = probeDrafts[probeDrafts.length - 1] || null;
         return `
           <div class=\"stack\">
             <div style=\"display:flex; align-items:center; gap:12px; flex-wrap:wrap;\">
@@ -919,7 +1792,7 @@ def _html_shell() -> str:
               </div>
               <div class=\"callout stack\">
                 <div><strong>ProbePlan draft</strong> (missingFields + followUpQuestions)</div>
-                <div id=\"probe-plan-preview\">${renderProbePreview(latestServerDraft || loadLocalProbePlan(data.requestId))}</div>
+                <div id=\"probe-plan-preview\">${renderProbePreview(initialProbeDraft(data))}</div>
                 <div class=\"meta-actions\">
                   <button id=\"save-probe-plan\" class=\"pill-button\">Queue to review</button>
                   <span id=\"probe-plan-status\" class=\"small muted\"></span>
@@ -931,53 +1804,136 @@ def _html_shell() -> str:
         `;
       }
 
+      // Detail payloads from recent visits in this tab, keyed by run. A revisit
+      // paints from here at once, then revalidates with the server's ETag.
+      const DETAIL_CACHE_PREFIX = 'runDetail:';
+
+      function readCachedDetail(key) {
+        try {
+          const raw = sessionStorage.getItem(DETAIL_CACHE_PREFIX + key);
+          return raw ? JSON.parse(raw) : null;
+        } catch {
+          return null;
+        }
+      }
+
+      function storeCachedDetail(key, entry) {
+        try {
+          sessionStorage.setItem(DETAIL_CACHE_PREFIX + key, JSON.stringify(entry));
+        } catch {
+          // Quota exceeded or storage disabled: the cache is only an optimization.
+          sessionStorage.removeItem(DETAIL_CACHE_PREFIX + key);
+        }
+      }
+
+      async function cacheFirst(key, url, render) {
+        const cached = readCachedDetail(key);
+        if (cached) render(JSON.parse(cached.body));
+        const headers = cached && cached.etag ? { 'If-None-Match': cached.etag } : {};
+        const res = await fetch(url, { headers });
+        if (cached && res.status === 304) return;
+        const body = await res.text();
+        if (res.ok) storeCachedDetail(key, { etag: res.headers.get('ETag'), body });
+        // Only repaint when the run changed since the cached copy was stored.
+        if (!cached || cached.body !== body) render(JSON.parse(body));
+      }
+
+      // Tabs whose data comes from /dev/logs/api/run/<date>/<id>/<section>,
+      // fetched the first time the tab is opened.
+      const SECTION_PLACEHOLDER = '<div class=\"small muted\">Loading...</div>';
+      const SECTION_RENDERERS = {
+        transcript: (data) => renderTranscript(data.transcript),
+        evidence: (data) => renderEvidence(data.evidenceMap),
+        assets: (data) => renderAssets(data.assets, data.linkedAssetsHtml),
+        diff: (data) => renderDiff(data.diffExtraction || ''),
+      };
+
+      function bindSection(panel, dateBucket, requestId, section) {
+        let started = false;
+        return () => {
+          if (started) return;
+          started = true;
+          const render = (data) => {
+            // Renderers return markup for empty states and built nodes for tables.
+            const content = SECTION_RENDERERS[section](data);
+            if (typeof content === 'string') panel.innerHTML = content;
+            else panel.replaceChildren(content);
+          };
+          cacheFirst(`${dateBucket}/${requestId}/${section}`, `/dev/logs/api/run/${dateBucket}/${requestId}/${section}`, render).catch(
+            () => {
+              panel.innerHTML = '<div class=\"small\">Unavailable.</div>';
+            }
+          );
+        };
+      }
+
       async function renderDetail() {
         const [_, __, ___, dateBucket, requestId] = pathParts;
-        const res = await fetch(`/dev/logs/api/run/${dateBucket}/${requestId}`);
-        const data = await res.json();
+        await cacheFirst(`${dateBucket}/${requestId}`, `/dev/logs/api/run/${dateBucket}/${requestId}`, (data) =>
+          paintDetail(dateBucket, requestId, data)
+        );
+      }
 
+      function paintDetail(dateBucket, requestId, data) {
         const detail = document.getElementById('detail-view').content.cloneNode(true);
         detail.querySelector('#meta').innerHTML = renderMeta(data);
         const tabs = [
           { id: 'request', label: 'Request', content: renderRequestTab(data) },
-          { id: 'transcript', label: 'Transcript', content: renderTranscript(data.transcript) },
-          { id: 'evidence', label: 'Evidence Map', content: renderEvidence(data.evidenceMap, data.transcript) },
-          { id: 'assets', label: 'Assets', content: renderAssets(data.assets) },
-          { id: 'diff', label: 'Diff', content: renderDiff(data.diffExtraction || '') },
+          { id: 'transcript', label: 'Transcript', content: SECTION_PLACEHOLDER },
+          { id: 'evidence', label: 'Evidence Map', content: SECTION_PLACEHOLDER },
+          { id: 'assets', label: 'Assets', content: SECTION_PLACEHOLDER },
+          { id: 'diff', label: 'Diff', content: SECTION_PLACEHOLDER },
+          { id: 'raw', label: 'Raw files', content: renderRawFilesTab() },
         ];
+        // Per-tab hooks run when a tab is opened (sections and raw files are fetched lazily).
+        const onActivate = {};
 
         const tabsEl = detail.querySelector('#tabs');
         const panelsEl = detail.querySelector('#tab-panels');
 
+        // Buttons and panels are assembled in fragments and attached in one go,
+        // so the whole detail view reaches the live DOM in a single insertion.
+        const tabFrag = document.createDocumentFragment();
+        const panelFrag = document.createDocumentFragment();
+        // Node references kept from construction, so switching tabs never queries the DOM.
+        const tabNodes = [];
+        const panelNodes = [];
+        const tabIndex = {};
         tabs.forEach((tab, idx) => {
           const btn = document.createElement('button');
           btn.className = 'tab' + (idx === 0 ? ' active' : '');
           btn.textContent = tab.label;
           btn.dataset.target = tab.id;
-          tabsEl.appendChild(btn);
+          tabFrag.appendChild(btn);
 
           const panel = document.createElement('div');
           panel.id = tab.id;
           panel.className = 'tab-content' + (idx === 0 ? ' active' : '');
           panel.innerHTML = tab.content;
-          panelsEl.appendChild(panel);
+          panelFrag.appendChild(panel);
+
+          tabNodes.push(btn);
+          panelNodes.push(panel);
+          tabIndex[tab.id] = idx;
         });
+        tabsEl.appendChild(tabFrag);
+        panelsEl.appendChild(panelFrag);
 
         tabsEl.addEventListener('click', (event) => {
           if (!(event.target instanceof HTMLElement)) return;
-          if (!event.target.dataset.target) return;
           const target = event.target.dataset.target;
-          document.querySelectorAll('.tab').forEach((tab) => tab.classList.remove('active'));
-          event.target.classList.add('active');
-          panelsEl.querySelectorAll('.tab-content').forEach((panel) => {
-            panel.classList.toggle('active', panel.id === target);
-          });
+          if (!(target in tabIndex)) return;
+          const active = tabIndex[target];
+          tabNodes.forEach((node, idx) => node.classList.toggle('active', idx === active));
+          panelNodes.forEach((node, idx) => node.classList.toggle('active', idx === active));
+          if (onActivate[target]) onActivate[target]();
         });
 
         app.innerHTML = '';
         app.appendChild(detail);
+        // appendChild empties the template fragment, so later lookups go through app.
 
-        const downloadButton = detail.querySelector('#download-bundle');
+        const downloadButton = app.querySelector('#download-bundle');
         if (downloadButton) {
           downloadButton.addEventListener('click', async () => {
             downloadButton.disabled = true;
@@ -1003,17 +1959,20 @@ def _html_shell() -> str:
           });
         }
 
-        bindNotes(detail, data, requestId);
-        bindProbePlan(detail, data, requestId, dateBucket);
+        onActivate.raw = bindRawFiles(panelsEl, dateBucket, requestId);
+        loadSystemPrompt(app.querySelector('#system-prompt'), dateBucket, requestId);
+        Object.keys(SECTION_RENDERERS).forEach((id) => {
+          onActivate[id] = bindSection(panelNodes[tabIndex[id]], dateBucket, requestId, id);
+        });
+        bindNotes(app, data, requestId);
+        bindProbePlan(app, data, requestId, dateBucket);
       }
 
       async function boot() {
         if (isDetail) {
           await renderDetail();
         } else {
-          const res = await fetch('/dev/logs/api/runs');
-          const payload = await res.json();
-          renderList(payload.runs || []);
+          await renderList();
         }
       }
       boot();
@@ -1022,6 +1981,65 @@ def _html_shell() -> str:
 </html>
 """
 
+# Encoded, compressed and fingerprinted once at import so page views only
+# write bytes. Each encoding gets its own strong ETag, as HTTP requires.
+_HTML_SHELL_BYTES = _HTML_SHELL.encode("utf-8")
+_HTML_SHELL_GZIP = gzip.compress(_HTML_SHELL_BYTES, compresslevel=9, mtime=0)
+_HTML_SHELL_ETAG = f'"{hashlib.sha256(_HTML_SHELL_BYTES).hexdigest()[:32]}"'
+_HTML_SHELL_GZIP_ETAG = f'{_HTML_SHELL_ETAG[:-1]}-gzip"'
+# Content-Length header values, keyed by "gzipped?".
+_HTML_SHELL_LENGTHS = {False: str(len(_HTML_SHELL_BYTES)), True: str(len(_HTML_SHELL_GZIP))}
+
+
+def _html_shell(gzipped: bool = False) -> bytes:
+    """
+    Return the single-page HTML (vanilla JS) used for both list and detail views.
+    The JS detects whether the path looks like /dev/logs/<date>/<id> and fetches
+    the appropriate API endpoint.
+    """
+    return _HTML_SHELL_GZIP if gzipped else _HTML_SHELL_BYTES
+
+
+@functools.lru_cache(maxsize=64)
+def _error_body(message: str) -> bytes:
+    """Encoded ``{"error": message}``; the handler's error replies are a small fixed set."""
+    return _json_dumps({"error": message})
+
+
+class _ChunkedWriter:
+    """
+    Minimal file-like object that frames writes as HTTP/1.1 chunks.
+
+    ``zipfile`` emits many tiny writes (local headers are a few dozen bytes),
+    so data is coalesced into ``chunk_size`` pieces before framing. Memory
+    stays O(chunk_size) no matter how large the bundle is.
+    """
+
+    def __init__(self, out: io.BufferedIOBase, chunk_size: int = 64 * 1024) -> None:
+        self._out = out
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._emit()
+        return len(data)
+
+    def flush(self) -> None:
+        # Chunks go out when full or on close(); zipfile's flushes are no-ops.
+        pass
+
+    def _emit(self) -> None:
+        if self._buffer:
+            self._out.write(b"%x\r\n" % len(self._buffer) + self._buffer + b"\r\n")
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Send any buffered bytes followed by the terminating zero-length chunk."""
+        self._emit()
+        self._out.write(b"0\r\n\r\n")
+
 
 class DevLogViewerHandler(SimpleHTTPRequestHandler):
     """
@@ -1030,85 +2048,327 @@ class DevLogViewerHandler(SimpleHTTPRequestHandler):
     simple for new contributors.
     """
 
+    # HTTP/1.1 is required for chunked ZIP downloads. Every other response
+    # sets Content-Length (or has no body), so connections can be reused.
+    protocol_version = "HTTP/1.1"
+    # Keep-alive connections each hold a server thread while idle; a socket
+    # timeout hands that thread back after the browser goes quiet.
+    timeout = KEEPALIVE_IDLE_SECONDS
+
+    def _accepts_gzip(self) -> bool:
+        """True when the client advertised gzip in Accept-Encoding."""
+        return "gzip" in (self.headers.get("Accept-Encoding") or "").lower()
+
     def _send_json(self, payload: Any, status: HTTPStatus = HTTPStatus.OK) -> None:
-        """Write a JSON response with the provided status code."""
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        """
+        Write a JSON response with the provided status code.
+
+        Detail payloads embed whole trace files, so larger bodies are gzipped
+        when the browser allows it. Level 1 is several times faster than the
+        default and compresses JSON nearly as well.
+        """
+        self._send_json_bytes(_json_dumps(payload), status)
+
+    def _send_json_error(self, message: str, status: HTTPStatus) -> None:
+        """Send ``{"error": message}``; bodies are encoded once per distinct message."""
+        self._send_json_bytes(_error_body(message), status)
+
+    def _send_json_bytes(
+        self, body: bytes, status: HTTPStatus, etag: Optional[str] = None, last_modified: Optional[int] = None
+    ) -> None:
+        """
+        Write an already-encoded JSON body (see :meth:`_send_json`).
+
+        ``etag`` names the uncompressed body. Clients that accept gzip get a
+        suffixed tag, since the bytes they receive may differ.
+        ``last_modified`` (epoch seconds) is sent as Last-Modified.
+        """
+        compressed = len(body) >= GZIP_MIN_BYTES and self._accepts_gzip()
+        if compressed:
+            # mtime=0 keeps the gzip bytes stable for a given body.
+            body = gzip.compress(body, compresslevel=1, mtime=0)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        if etag is not None:
+            self.send_header("ETag", self._encoded_etag(etag))
+        self._send_last_modified(last_modified)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
-    def _send_html(self, html: str) -> None:
-        """Serve the SPA shell HTML."""
-        body = html.encode("utf-8")
+    def _send_last_modified(self, last_modified: Optional[int]) -> None:
+        """
+        Emit Last-Modified, unless the newest input changed this very second.
+
+        The header has one-second precision: a write later in the same second
+        would keep the same value, and an If-Modified-Since-only client would
+        be told its copy is current. Skipping the header until the second is
+        over avoids that; the ETag still covers those responses.
+        """
+        if last_modified is not None and last_modified < int(time.time()):
+            self.send_header("Last-Modified", self.date_time_string(last_modified))
+
+    def _encoded_etag(self, etag: str) -> str:
+        """The ETag for the representation this client is sent (see :meth:`_send_json_bytes`)."""
+        return f'{etag[:-1]}-gzip"' if self._accepts_gzip() else etag
+
+    def _not_modified(self, etag: str, last_modified: Optional[int] = None) -> bool:
+        """
+        Answer 304 and return True when the client's copy is current.
+
+        If-None-Match must name ``etag``. Only when the client sent no
+        If-None-Match (as RFC 9110 requires) is If-Modified-Since compared
+        with ``last_modified`` instead. Dates stay a fallback because removing
+        a file can make a bundle older without changing any remaining mtime.
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if if_none_match != etag:
+                return False
+        elif not self._unmodified_since(last_modified):
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self._send_last_modified(last_modified)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return True
+
+    def _unmodified_since(self, last_modified: Optional[int]) -> bool:
+        """True when If-Modified-Since is a valid date no older than ``last_modified``."""
+        header = self.headers.get("If-Modified-Since")
+        if last_modified is None or not header or last_modified >= int(time.time()):
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return last_modified <= since.timestamp()
+
+    def _send_html(self) -> None:
+        """
+        Serve the SPA shell HTML, gzipped when the browser allows it.
+
+        The shell only changes when this file does, so a strong ETag lets
+        repeat page loads finish with an empty 304, and a short max-age lets
+        list/detail navigations reuse it without asking at all.
+        """
+        gzipped = self._accepts_gzip()
+        etag = _HTML_SHELL_GZIP_ETAG if gzipped else _HTML_SHELL_ETAG
+        if self._not_modified(etag):
+            return
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", HTML_SHELL_CACHE_CONTROL)
+        self.send_header("Content-Length", _HTML_SHELL_LENGTHS[gzipped])
         self.end_headers()
-        self.wfile.write(body)
+        self.wfile.write(_html_shell(gzipped))
+
+    def _send_file(self, path: str, content_type: str, missing_body: bytes = b"{}") -> None:
+        """
+        Send a file's bytes unchanged, with an ETag from its stat.
+
+        ``socket.sendfile`` lets the kernel copy the file to the socket (no
+        read into Python, no parse, no re-encode). Length and ETag come from
+        the open descriptor, so they describe the bytes actually sent. A
+        missing file is answered with ``missing_body`` (an empty JSON object
+        unless the caller says otherwise).
+        """
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(missing_body)))
+            self.end_headers()
+            self.wfile.write(missing_body)
+            return
+        with handle:
+            stat = os.fstat(handle.fileno())
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            last_modified = stat.st_mtime_ns // 1_000_000_000
+            if self._not_modified(etag, last_modified):
+                return
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type)
+            self.send_header("ETag", etag)
+            self._send_last_modified(last_modified)
+            self.send_header("Content-Length", str(stat.st_size))
+            self.end_headers()
+            sent = self.connection.sendfile(handle, 0, stat.st_size) if stat.st_size else 0
+            if sent < stat.st_size:
+                # Truncated while sending: the framing is broken, so drop the connection.
+                self.close_connection = True
+
+    def _end_streamed_headers(self, chunk_size: int = 64 * 1024) -> Optional[_ChunkedWriter]:
+        """
+        Finish the headers of a response whose length is not known up front.
+
+        HTTP/1.1 clients get chunked framing (the connection stays reusable)
+        and the returned writer, which the caller must close. HTTP/1.0
+        clients get None: write to ``self.wfile`` and the body ends when the
+        connection closes.
+        """
+        if self.request_version == "HTTP/1.1":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            return _ChunkedWriter(self.wfile, chunk_size)
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+        return None
 
-    def do_GET(self) -> None:
-        parsed = urllib.parse.urlparse(self.path)
-        path = parsed.path
+    def _read_json_body(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and parse a JSON object request body, or return None if invalid.
 
-        if path.startswith("/api/dev/trace-bundle/download"):
-            if not _dev_bundle_download_enabled():
-                # Return a soft 404 to avoid exposing the endpoint outside dev.
-                self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
-                return
+        The raw bytes go straight to the parser (no intermediate ``str``);
+        undecodable UTF-8 is a ValueError on both backends.
+        """
+        content_length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(content_length) if content_length > 0 else b""
+        try:
+            payload = _json_loads(body)
+        except ValueError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    # GET dispatch, tried in order. Patterns are anchored only at the start,
+    # matching the prefix routing the viewer has always used; captured
+    # groups become handler arguments after the parsed URL.
+    _GET_ROUTES = (
+        (re.compile(r"/api/dev/trace-bundle/download"), "_get_bundle_download"),
+        (re.compile(r"/dev/logs/api/runs"), "_get_runs"),
+        (re.compile(r"/dev/logs/api/run/+([^/]+)/+([^/]+)/+file/+([^/]+)"), "_get_run_file"),
+        (re.compile(r"/dev/logs/api/run/+([^/]+)/+([^/]+)/+([^/]+)"), "_get_run_section"),
+        (re.compile(r"/dev/logs/api/run/+([^/]+)/+([^/]+)"), "_get_run_detail"),
+        (re.compile(r"/dev/logs/api/run/"), "_get_run_usage"),
+        (re.compile(r"/dev/logs"), "_get_shell"),
+    )
 
-            params = urllib.parse.parse_qs(parsed.query)
-            request_id_values = params.get("requestId")
-            if not request_id_values or not request_id_values[0]:
-                self._send_json({"error": "requestId is required"}, HTTPStatus.BAD_REQUEST)
+    def do_GET(self) -> None:
+        parsed = urllib.parse.urlparse(self.path)
+        for pattern, handler_name in self._GET_ROUTES:
+            match = pattern.match(parsed.path)
+            if match:
+                getattr(self, handler_name)(parsed, *match.groups())
                 return
+        # Fallback to default behavior (e.g., serve files if needed).
+        super().do_GET()
 
-            request_id = request_id_values[0]
-            bundle = _find_bundle_by_request_id(request_id)
-            if not bundle:
-                self._send_json({"error": "bundle not found"}, HTTPStatus.NOT_FOUND)
-                return
+    def _get_bundle_download(self, parsed: urllib.parse.ParseResult) -> None:
+        if not _dev_bundle_download_enabled():
+            # Return a soft 404 to avoid exposing the endpoint outside dev.
+            self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
+            return
 
-            _, bundle_path = bundle
-            payload = _zip_bundle(bundle_path)
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-Type", "application/zip")
-            self.send_header("Content-Disposition", f'attachment; filename="{request_id}.zip"')
-            self.send_header("Content-Length", str(len(payload)))
-            self.end_headers()
-            self.wfile.write(payload)
+        params = urllib.parse.parse_qs(parsed.query)
+        request_id_values = params.get("requestId")
+        if not request_id_values or not request_id_values[0]:
+            self._send_json_error("requestId is required", HTTPStatus.BAD_REQUEST)
             return
 
-        if path.startswith("/dev/logs/api/runs"):
-            runs = _build_runs_inventory()
-            self._send_json({"runs": runs})
+        request_id = request_id_values[0]
+        bundle = _find_bundle_by_request_id(request_id)
+        if not bundle:
+            self._send_json_error("bundle not found", HTTPStatus.NOT_FOUND)
             return
 
-        if path.startswith("/dev/logs/api/run/"):
-            segments = [seg for seg in path.split("/") if seg]
-            # Expect ["dev", "logs", "api", "run", "<date>", "<requestId>"]
-            if len(segments) < 6:
-                self._send_json({"error": "expected /dev/logs/api/run/<date>/<requestId>"}, HTTPStatus.BAD_REQUEST)
-                return
-            date_bucket, request_id = segments[4], segments[5]
-            detail = _load_run_detail(date_bucket, request_id)
-            parsed_output = detail.get("parsedOutput") or {}
-            final_output = detail.get("finalOutput") or {}
-            if parsed_output or final_output:
-                detail["diffExtraction"] = _diff_extraction(parsed_output, final_output)
-            else:
-                detail["diffExtraction"] = ""
-            self._send_json(detail)
+        _, bundle_path = bundle
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Disposition", f'attachment; filename="{request_id}.zip"')
+        # No Content-Length: the archive is compressed while it is sent.
+        writer = self._end_streamed_headers()
+        _zip_bundle(bundle_path, writer or self.wfile)
+        if writer is not None:
+            writer.close()
+
+    def _get_runs(self, parsed: urllib.parse.ParseResult) -> None:
+        params = urllib.parse.parse_qs(parsed.query)
+        try:
+            keep = _run_filter(params)
+        except ValueError:
+            self._send_json_error("missing, duration and tokens must be numbers", HTTPStatus.BAD_REQUEST)
+            return
+        if params.get("format") == ["ndjson"]:
+            # One JSON object per line, sent while later bundles are still
+            # loading, so the list can render its first rows early.
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+            # Rows are small; 4 KiB chunks keep them flowing without a
+            # syscall per row.
+            writer = self._end_streamed_headers(chunk_size=4 * 1024)
+            out = writer or self.wfile
+            for run in _stream_runs_inventory():
+                if keep is None or keep(run):
+                    out.write(_json_dumps(run) + b"\n")
+            if writer is not None:
+                writer.close()
+            return
+        _, _, runs, body, etag = _runs_inventory_entry()
+        if keep is not None:
+            self._send_json({"runs": [run for run in runs if keep(run)]})
+        elif not self._not_modified(self._encoded_etag(etag)):
+            self._send_json_bytes(body, HTTPStatus.OK, etag)
+
+    def _get_run_file(self, parsed: urllib.parse.ParseResult, date_bucket: str, request_id: str, blob_key: str) -> None:
+        # Lazy sub-resource: /dev/logs/api/run/<date>/<requestId>/file/<key>
+        if blob_key in _DETAIL_TEXT_FILES:
+            path = LOG_ROOT / date_bucket / request_id / _DETAIL_TEXT_FILES[blob_key]
+            self._send_file(str(path), "text/plain; charset=utf-8", missing_body=b"")
+            return
+        if blob_key not in _DETAIL_BLOB_FILES:
+            self._send_json_error(f"unknown file key: {blob_key}", HTTPStatus.NOT_FOUND)
+            return
+        entry = _run_blob_entry(date_bucket, request_id, blob_key)
+        if entry is None:
+            self._send_json({})
             return
+        self._send_file(entry.path, "application/json; charset=utf-8")
+
+    def _get_run_detail(self, parsed: urllib.parse.ParseResult, date_bucket: str, request_id: str) -> None:
+        # Conditional GET: the signature costs one listing plus a few stats,
+        # so an unchanged run is answered without loading or encoding it.
+        signature = _run_detail_signature(_scan_bundle_files(LOG_ROOT / date_bucket / request_id))
+        etag = _run_detail_etag(date_bucket, request_id, signature)
+        file_keys, notes_key, queue_key = signature
+        last_modified = _signature_last_modified([*file_keys, notes_key, queue_key])
+        if self._not_modified(self._encoded_etag(etag), last_modified):
+            return
+        body = _run_detail_body(date_bucket, request_id, signature)
+        self._send_json_bytes(body, HTTPStatus.OK, etag, last_modified)
 
-        if path.startswith("/dev/logs"):
-            # Serve the SPA shell for both list and detail routes.
-            self._send_html(_html_shell())
+    def _get_run_section(self, parsed: urllib.parse.ParseResult, date_bucket: str, request_id: str, section: str) -> None:
+        # Lazy per-tab slice: /dev/logs/api/run/<date>/<requestId>/<section>
+        if section not in _RUN_DETAIL_SECTIONS:
+            self._send_json_error(f"unknown detail section: {section}", HTTPStatus.NOT_FOUND)
+            return
+        # Sections only read bundle files, so notes and queue appends (the
+        # rest of the detail signature) leave their ETags alone.
+        file_keys = _run_detail_signature(_scan_bundle_files(LOG_ROOT / date_bucket / request_id))[0]
+        etag = _run_detail_etag(date_bucket, request_id, (section, file_keys))
+        last_modified = _signature_last_modified(file_keys)
+        if self._not_modified(self._encoded_etag(etag), last_modified):
             return
+        body = _run_section_body(date_bucket, request_id, section, file_keys)
+        self._send_json_bytes(body, HTTPStatus.OK, etag, last_modified)
 
-        # Fallback to default behavior (e.g., serve files if needed).
-        super().do_GET()
+    def _get_run_usage(self, parsed: urllib.parse.ParseResult) -> None:
+        self._send_json_error("expected /dev/logs/api/run/<date>/<requestId>", HTTPStatus.BAD_REQUEST)
+
+    def _get_shell(self, parsed: urllib.parse.ParseResult) -> None:
+        # Serve the SPA shell for both list and detail routes.
+        self._send_html()
 
     def do_POST(self) -> None:
         parsed = urllib.parse.urlparse(self.path)
@@ -1119,21 +2379,18 @@ class DevLogViewerHandler(SimpleHTTPRequestHandler):
                 self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
                 return
 
-            content_length = int(self.headers.get("Content-Length") or 0)
-            body = self.rfile.read(content_length) if content_length > 0 else b""
-            try:
-                payload = json.loads(body.decode("utf-8"))
-            except json.JSONDecodeError:
-                self._send_json({"error": "invalid JSON body"}, HTTPStatus.BAD_REQUEST)
+            payload = self._read_json_body()
+            if payload is None:
+                self._send_json_error("invalid JSON body", HTTPStatus.BAD_REQUEST)
                 return
 
             request_id = payload.get("requestId")
             note_text = payload.get("note")
             if not request_id or not isinstance(request_id, str):
-                self._send_json({"error": "requestId is required"}, HTTPStatus.BAD_REQUEST)
+                self._send_json_error("requestId is required", HTTPStatus.BAD_REQUEST)
                 return
             if not note_text or not isinstance(note_text, str):
-                self._send_json({"error": "note is required"}, HTTPStatus.BAD_REQUEST)
+                self._send_json_error("note is required", HTTPStatus.BAD_REQUEST)
                 return
 
             note_entry = _append_note_for_request(request_id, note_text)
@@ -1146,41 +2403,38 @@ class DevLogViewerHandler(SimpleHTTPRequestHandler):
                 self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
                 return
 
-            content_length = int(self.headers.get("Content-Length") or 0)
-            body = self.rfile.read(content_length) if content_length > 0 else b""
-            try:
-                payload = json.loads(body.decode("utf-8"))
-            except json.JSONDecodeError:
-                self._send_json({"error": "invalid JSON body"}, HTTPStatus.BAD_REQUEST)
+            payload = self._read_json_body()
+            if payload is None:
+                self._send_json_error("invalid JSON body", HTTPStatus.BAD_REQUEST)
                 return
 
             request_id = payload.get("requestId")
             date_bucket = payload.get("dateBucket") or _today_str()
             draft_text = payload.get("draftText") or ""
-            missing_fields = payload.get("missingFields") or []
-            follow_up_questions = payload.get("followUpQuestions") or []
-            tags = payload.get("tags") or []
+            missing_fields = _as_str_list(payload.get("missingFields") or [])
+            follow_up_questions = _as_str_list(payload.get("followUpQuestions") or [])
+            tags = _as_str_list(payload.get("tags") or [])
 
             if not request_id or not isinstance(request_id, str):
-                self._send_json({"error": "requestId is required"}, HTTPStatus.BAD_REQUEST)
+                self._send_json_error("requestId is required", HTTPStatus.BAD_REQUEST)
                 return
             if not isinstance(draft_text, str) or not draft_text.strip():
-                self._send_json({"error": "draftText is required"}, HTTPStatus.BAD_REQUEST)
+                self._send_json_error("draftText is required", HTTPStatus.BAD_REQUEST)
                 return
-            if not isinstance(missing_fields, list) or not isinstance(follow_up_questions, list):
-                self._send_json({"error": "missingFields and followUpQuestions must be lists"}, HTTPStatus.BAD_REQUEST)
+            if missing_fields is None or follow_up_questions is None:
+                self._send_json_error("missingFields and followUpQuestions must be lists", HTTPStatus.BAD_REQUEST)
                 return
-            if not isinstance(tags, list):
-                self._send_json({"error": "tags must be a list"}, HTTPStatus.BAD_REQUEST)
+            if tags is None:
+                self._send_json_error("tags must be a list", HTTPStatus.BAD_REQUEST)
                 return
 
             entry = _enqueue_probe_plan(
                 request_id=request_id,
                 date_bucket=str(date_bucket),
                 draft_text=draft_text,
-                missing_fields=[str(item) for item in missing_fields],
-                follow_up_questions=[str(item) for item in follow_up_questions],
-                tags=[str(item) for item in tags],
+                missing_fields=missing_fields,
+                follow_up_questions=follow_up_questions,
+                tags=tags,
             )
             self._send_json({"queued": entry, "existing": _load_probe_plans_for_request(request_id)})
             return
@@ -1188,13 +2442,38 @@ class DevLogViewerHandler(SimpleHTTPRequestHandler):
         self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
 
 
+class DevLogViewerServer(ThreadingHTTPServer):
+    """
+    Threaded server for :class:`DevLogViewerHandler`.
+
+    Connections are kept alive (see ``protocol_version``), so the browser's
+    burst of fetches on boot shares a thread and a TCP handshake.
+    """
+
+    def __init__(self, server_address: Tuple[str, int], reuse_port: bool = False) -> None:
+        self.reuse_port = reuse_port
+        super().__init__(server_address, DevLogViewerHandler)
+
+    def server_bind(self) -> None:
+        # Opt-in only: with SO_REUSEPORT a second viewer on the same port
+        # silently shares it instead of failing with "address in use".
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
 def main() -> None:
     """CLI entrypoint for launching the viewer server."""
     parser = argparse.ArgumentParser(description="Developer log viewer server")
     parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument(
+        "--reuse-port",
+        action="store_true",
+        help="Set SO_REUSEPORT so several viewer processes can share the port (the kernel spreads connections)",
+    )
     args = parser.parse_args()
 
-    server = ThreadingHTTPServer(("0.0.0.0", args.port), DevLogViewerHandler)
+    server = DevLogViewerServer(("0.0.0.0", args.port), reuse_port=args.reuse_port)
     print(f"Dev Log Viewer running at http://localhost:{args.port}/dev/logs")
     try:
         server.serve_forever()
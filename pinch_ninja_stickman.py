@@ -7,6 +7,7 @@ How to play:
 - Make a pinch with your thumb and index finger to swing the stickman's sword.
 - Hit the bouncing targets before the 30-second timer ends.
 - Press 'r' to restart or 'q' to quit at any time.
+- Press 'd' to show/hide the detected hand landmarks.
 """
 
 # ============================= EDIT HERE =============================
@@ -22,60 +23,120 @@ SLASH_SWEEP_DEG = 80           # How wide the slash arc swings (degrees)
 HIT_RADIUS = 28                # Distance from slash line that counts as a hit (pixels)
 SCORE_PER_HIT = 10             # Points per target hit
 GAME_DURATION = 30             # Seconds per round
+INFER_EVERY = 2                # Run hand detection every Nth frame (1 => every frame; faster FPS when higher)
+DEBUG_DRAW = False             # Draw hand landmarks at startup (toggle with 'd'; costs a few ms per frame)
 WINDOW_NAME = "Pinch Ninja Stickman"
+CAPTURE_WIDTH = 640            # Requested camera size; smaller frames mean faster detection
+CAPTURE_HEIGHT = 480           # (the camera may pick the nearest size it supports)
+CAPTURE_FPS = 30               # Requested camera frame rate
+INFER_WIDTH = 320              # Hand detection runs on a copy shrunk to this width (display stays sharp)
+HAND_MODEL_PATH = "hand_landmarker.task"  # Optional faster hand model; used (on the GPU when possible) if this file exists
 # ====================================================================
 
 import importlib.util
 import math
+import os
 import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import cv2
 import mediapipe as mp
 import numpy as np
 
+# Camera plumbing (not game feel, so it lives outside the EDIT HERE zone).
+FRAME_WAIT_SECONDS = 2.0       # Give up if the camera sends nothing for this long
 
-# Helper dataclass to store target state.
+
+# Helper dataclass to store the state of every target at once.
+# Row i of each array belongs to target i, so NumPy can update all of them in one go.
 @dataclass
-class Target:
-    position: np.ndarray  # shape (2,) as [x, y]
-    velocity: np.ndarray  # shape (2,) as [vx, vy]
-
-    def move(self, width: int, height: int) -> None:
-        """Move the target and bounce off window borders."""
-        self.position += self.velocity
-        # Bounce horizontally
-        if self.position[0] <= TARGET_RADIUS or self.position[0] >= width - TARGET_RADIUS:
-            self.velocity[0] *= -1
-            self.position[0] = np.clip(self.position[0], TARGET_RADIUS, width - TARGET_RADIUS)
-        # Bounce vertically
-        if self.position[1] <= TARGET_RADIUS or self.position[1] >= height - TARGET_RADIUS:
-            self.velocity[1] *= -1
-            self.position[1] = np.clip(self.position[1], TARGET_RADIUS, height - TARGET_RADIUS)
-
-    def respawn(self, width: int, height: int) -> None:
-        """Place the target at a new random position and velocity."""
-        self.position = np.array([
-            random.randint(TARGET_RADIUS, width - TARGET_RADIUS),
-            random.randint(TARGET_RADIUS, height - TARGET_RADIUS),
-        ], dtype=np.float32)
-        speed = random.uniform(*TARGET_SPEED_RANGE)
-        angle = random.uniform(0, 2 * math.pi)
-        self.velocity = np.array([math.cos(angle), math.sin(angle)], dtype=np.float32) * speed
-
-
-def create_targets(width: int, height: int) -> List[Target]:
-    """Spawn a list of targets with random positions and velocities."""
-    targets: List[Target] = []
-    for _ in range(TARGET_COUNT):
-        t = Target(position=np.zeros(2, dtype=np.float32), velocity=np.zeros(2, dtype=np.float32))
-        t.respawn(width, height)
-        targets.append(t)
+class Targets:
+    positions: np.ndarray   # shape (N, 2), rows of [x, y]
+    velocities: np.ndarray  # shape (N, 2), rows of [vx, vy]
+    pixels: np.ndarray      # shape (N, 2), int32 copy of positions for drawing (reused every frame)
+
+    def move_all(self, width: int, height: int) -> None:
+        """Move every target and bounce off window borders."""
+        self.positions += self.velocities
+        high = np.array([width - TARGET_RADIUS, height - TARGET_RADIUS], dtype=np.float32)
+        # Touching a border flips that direction (x and y bounce separately).
+        at_border = (self.positions <= TARGET_RADIUS) | (self.positions >= high)
+        self.velocities[at_border] *= -1
+        np.clip(self.positions, TARGET_RADIUS, high, out=self.positions)
+
+    def step(
+        self, width: int, height: int, slash: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
+    ) -> List[int]:
+        """Advance one frame: move every target, then return the ones the slash (if any) now touches."""
+        self.move_all(width, height)
+        if slash is None:
+            return []
+        return check_hits(self, *slash)
+
+    def pixel_positions(self) -> np.ndarray:
+        """Refresh and return the whole-pixel target centers (same rounding as `astype`)."""
+        np.copyto(self.pixels, self.positions, casting="unsafe")
+        return self.pixels
+
+    def respawn(self, indices: Iterable[int], width: int, height: int) -> None:
+        """Place the chosen targets at new random positions and velocities."""
+        for idx in indices:
+            self.positions[idx] = (
+                random.randint(TARGET_RADIUS, width - TARGET_RADIUS),
+                random.randint(TARGET_RADIUS, height - TARGET_RADIUS),
+            )
+            speed = random.uniform(*TARGET_SPEED_RANGE)
+            angle = random.uniform(0, 2 * math.pi)
+            self.velocities[idx] = (math.cos(angle) * speed, math.sin(angle) * speed)
+
+
+def create_targets(width: int, height: int) -> Targets:
+    """Spawn all targets with random positions and velocities."""
+    targets = Targets(
+        positions=np.zeros((TARGET_COUNT, 2), dtype=np.float32),
+        velocities=np.zeros((TARGET_COUNT, 2), dtype=np.float32),
+        pixels=np.zeros((TARGET_COUNT, 2), dtype=np.int32),
+    )
+    targets.respawn(range(TARGET_COUNT), width, height)
     return targets
 
 
+TARGET_COLOR = (0, 180, 80)  # BGR green
+
+
+def _target_stamp_offsets() -> Tuple[np.ndarray, np.ndarray]:
+    """Pixel offsets (dy, dx) from a target's center that a filled target circle covers."""
+    size = 2 * TARGET_RADIUS + 1
+    stamp = np.zeros((size, size), dtype=np.uint8)
+    cv2.circle(stamp, (TARGET_RADIUS, TARGET_RADIUS), TARGET_RADIUS, 255, -1)
+    dy, dx = np.nonzero(stamp)
+    return dy - TARGET_RADIUS, dx - TARGET_RADIUS
+
+
+# Drawn once with cv2.circle, so every target looks exactly as before.
+_TARGET_DY, _TARGET_DX = _target_stamp_offsets()
+
+
+def draw_targets(frame: np.ndarray, positions: np.ndarray) -> None:
+    """Paint every target (integer (N, 2) centers) onto `frame` with one NumPy write.
+
+    Instead of one `cv2.circle` call per target, the circle's pixel offsets
+    are added to every center at once and all those pixels are set together.
+    """
+    height, width = frame.shape[:2]
+    ys = (positions[:, 1, None] + _TARGET_DY).ravel()
+    xs = (positions[:, 0, None] + _TARGET_DX).ravel()
+    # Targets stay inside the window, but a circle touching the edge can reach
+    # one pixel past it; keep those pixels on the frame.
+    np.clip(ys, 0, height - 1, out=ys)
+    np.clip(xs, 0, width - 1, out=xs)
+    frame[ys, xs] = TARGET_COLOR
+
+
 def draw_stickman(frame: np.ndarray, center: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
     """Draw a simple stickman and return left/right hand positions."""
     cx, cy = center
@@ -101,53 +162,102 @@ def draw_stickman(frame: np.ndarray, center: Tuple[int, int]) -> Tuple[Tuple[int
     return left_hand, right_hand
 
 
+# The slash sweep only depends on the frame counter, so its end offsets are
+# worked out once here instead of with trig on every frame. The counter is
+# reset twice a second by the FPS meter, so it stays far below the table size;
+# a power-of-two size lets `& (size - 1)` wrap it just in case.
+_SLASH_STEPS = 1024
+_slash_angles = np.radians(20 + SLASH_SWEEP_DEG * np.sin(np.arange(_SLASH_STEPS) / 7.0))
+_SLASH_DX = (np.cos(_slash_angles) * SLASH_LENGTH).tolist()
+_SLASH_DY = (-np.sin(_slash_angles) * SLASH_LENGTH).tolist()
+
+
 def slash_line(right_hand: Tuple[int, int], frame_count: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
     """Create an animated slash line that sweeps over time."""
-    # Sweep angle oscillates to feel alive.
-    base_angle_deg = 20
-    sweep = SLASH_SWEEP_DEG * math.sin(frame_count / 7.0)
-    angle_rad = math.radians(base_angle_deg + sweep)
-    start = np.array(right_hand, dtype=np.float32)
-    direction = np.array([math.cos(angle_rad), -math.sin(angle_rad)], dtype=np.float32)
-    end = start + direction * SLASH_LENGTH
-    return tuple(start.astype(int)), tuple(end.astype(int))
-
-
-def point_line_distance(point: np.ndarray, start: np.ndarray, end: np.ndarray) -> float:
-    """Shortest distance from a point to a line segment."""
-    line = end - start
-    line_len_sq = float(np.dot(line, line))
+    # Sweep angle oscillates (20 degrees +/- SLASH_SWEEP_DEG) to feel alive.
+    step = frame_count & (_SLASH_STEPS - 1)
+    end = (int(right_hand[0] + _SLASH_DX[step]), int(right_hand[1] + _SLASH_DY[step]))
+    return right_hand, end
+
+
+def point_segment_distance_sq(points: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]) -> np.ndarray:
+    """Squared shortest distance from each point in `points` (shape (N, 2)) to a line segment."""
+    # The segment stays plain numbers; only the per-target columns are arrays.
+    sx, sy = start
+    line_x = end[0] - sx
+    line_y = end[1] - sy
+    line_len_sq = line_x * line_x + line_y * line_y
+    dx = points[:, 0] - sx
+    dy = points[:, 1] - sy
     if line_len_sq == 0:
-        return float(np.linalg.norm(point - start))
-    t = float(np.dot(point - start, line) / line_len_sq)
-    t = max(0.0, min(1.0, t))
-    projection = start + t * line
-    return float(np.linalg.norm(point - projection))
+        return dx * dx + dy * dy
+    # How far along the segment each point projects, clamped to the segment ends.
+    t = np.clip((dx * line_x + dy * line_y) / line_len_sq, 0.0, 1.0)
+    rx = dx - t * line_x
+    ry = dy - t * line_y
+    return rx * rx + ry * ry
+
 
+# Hit and pinch tests compare squared distances, so square the limits once.
+_HIT_RADIUS_SQ = HIT_RADIUS * HIT_RADIUS
+_PINCH_THRESHOLD_SQ = PINCH_THRESHOLD * PINCH_THRESHOLD
 
-def check_hits(targets: List[Target], slash_start: Tuple[int, int], slash_end: Tuple[int, int]) -> List[int]:
+
+def check_hits(targets: Targets, slash_start: Tuple[int, int], slash_end: Tuple[int, int]) -> List[int]:
     """Return indices of targets hit by the slash."""
-    hits = []
-    start = np.array(slash_start, dtype=np.float32)
-    end = np.array(slash_end, dtype=np.float32)
-    for idx, t in enumerate(targets):
-        dist = point_line_distance(t.position, start, end)
-        if dist <= HIT_RADIUS:
-            hits.append(idx)
-    return hits
+    # All targets are tested in one NumPy pass; squared distances spare the sqrt.
+    dist_sq = point_segment_distance_sq(targets.positions, slash_start, slash_end)
+    return np.flatnonzero(dist_sq <= _HIT_RADIUS_SQ).tolist()
+
+
+HUD_COLOR = (20, 40, 180)
+# Frame area the HUD can touch: the (10, 10)-(330, 140) box plus a few pixels
+# for its 2 px border, as (x0, y0, x1, y1).
+_HUD_AREA = (7, 7, 334, 144)
+
+
+def _hud_background() -> Tuple[np.ndarray, np.ndarray]:
+    """Draw the empty HUD box once; return its pixels and a mask of the pixels it covers."""
+    x0, y0, x1, y1 = _HUD_AREA
+    image = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+    covered = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    top_left, bottom_right = (10 - x0, 10 - y0), (330 - x0, 140 - y0)
+    cv2.rectangle(image, top_left, bottom_right, (255, 255, 255), -1)
+    cv2.rectangle(image, top_left, bottom_right, HUD_COLOR, 2)
+    cv2.rectangle(covered, top_left, bottom_right, 255, -1)
+    cv2.rectangle(covered, top_left, bottom_right, 255, 2)
+    return image, covered.astype(bool)[:, :, None]
+
+
+_HUD_BACKGROUND, _HUD_MASK = _hud_background()
+# The HUD box with its slow-changing text, keyed on (score, pinch_on).
+_hud_cache: Dict[str, Any] = {"key": None, "image": None}
 
 
 def draw_hud(frame: np.ndarray, score: int, remaining: float, pinch_on: bool, pinch_dist: float, fps: float) -> None:
-    """Draw heads-up display with score, timer, pinch info, and FPS."""
-    hud_color = (20, 40, 180)
-    pinch_text = "ON" if pinch_on else "OFF"
-    cv2.rectangle(frame, (10, 10), (330, 140), (255, 255, 255), -1)
-    cv2.rectangle(frame, (10, 10), (330, 140), hud_color, 2)
-    cv2.putText(frame, f"Score: {score}", (25, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, hud_color, 2)
-    cv2.putText(frame, f"Time: {remaining:05.2f}s", (25, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.8, hud_color, 2)
-    cv2.putText(frame, f"Pinch: {pinch_text}", (25, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.8, hud_color, 2)
-    cv2.putText(frame, f"Dist: {pinch_dist:.4f}", (170, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.6, hud_color, 2)
-    cv2.putText(frame, f"FPS: {fps:05.2f}", (25, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.6, hud_color, 2)
+    """Draw heads-up display with score, timer, pinch info, and FPS.
+
+    The box is drawn once (see `_hud_background`). Score and pinch state
+    change only now and then, so the box with their text is cached on those
+    two values and copied into each frame; the timer, distance and FPS
+    change every frame and are written on top.
+    """
+    x0, y0, x1, y1 = _HUD_AREA
+    key = (score, pinch_on)
+    if _hud_cache["key"] != key:
+        image = _HUD_BACKGROUND.copy()
+        pinch_text = "ON" if pinch_on else "OFF"
+        for text, (x, y) in ((f"Score: {score}", (25, 40)), (f"Pinch: {pinch_text}", (25, 100))):
+            cv2.putText(image, text, (x - x0, y - y0), cv2.FONT_HERSHEY_SIMPLEX, 0.8, HUD_COLOR, 2)
+        _hud_cache["key"], _hud_cache["image"] = key, image
+    # Clip like cv2's own drawing: a frame smaller than the HUD gets the part that fits.
+    height, width = frame.shape[:2]
+    h, w = min(y1, height) - y0, min(x1, width) - x0
+    if h > 0 and w > 0:
+        np.copyto(frame[y0:y0 + h, x0:x0 + w], _hud_cache["image"][:h, :w], where=_HUD_MASK[:h, :w])
+    cv2.putText(frame, f"Time: {remaining:05.2f}s", (25, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.8, HUD_COLOR, 2)
+    cv2.putText(frame, f"Dist: {pinch_dist:.4f}", (170, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.6, HUD_COLOR, 2)
+    cv2.putText(frame, f"FPS: {fps:05.2f}", (25, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.6, HUD_COLOR, 2)
 
 
 def load_mediapipe_components() -> Tuple[object, object, object]:
@@ -192,12 +302,185 @@ def load_mediapipe_components() -> Tuple[object, object, object]:
     return mp_solutions.hands, mp_solutions.drawing_utils, mp_solutions.drawing_styles
 
 
+def shrink_for_inference(frame: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return `frame` scaled down to INFER_WIDTH wide (same aspect ratio), or as-is if already small.
+
+    MediaPipe reports landmarks in 0..1 coordinates of whatever image it was
+    given, so results from the small copy line up with the full-size frame
+    (and pinch distances stay comparable) as long as the aspect ratio is kept.
+    A matching `dst` array is written into instead of allocating a new one.
+    """
+    height, width = frame.shape[:2]
+    if width <= INFER_WIDTH:
+        return frame
+    small_height = max(1, round(height * INFER_WIDTH / width))
+    return cv2.resize(frame, (INFER_WIDTH, small_height), dst=dst, interpolation=cv2.INTER_AREA)
+
+
+@dataclass
+class FrameBuffers:
+    """Arrays FrameGrabber writes one frame into, kept and reused for later frames."""
+
+    raw: Optional[np.ndarray] = None      # Camera frame as read
+    flipped: Optional[np.ndarray] = None  # Mirrored BGR frame (shown and drawn on)
+    small: Optional[np.ndarray] = None    # Shrunk copy for detection
+    rgb: Optional[np.ndarray] = None      # Shrunk copy in RGB order for MediaPipe
+
+
+class FrameGrabber(threading.Thread):
+    """Read webcam frames on a background thread, keeping only the newest one.
+
+    Camera reads, shrinking and the BGR->RGB conversion then overlap with
+    MediaPipe and drawing in the main loop, instead of taking turns with
+    them. Frames are written into three reusable sets of buffers instead of
+    fresh arrays. The thread only ever fills a set that is neither the
+    newest frame nor the one the main loop is working on, so a frame handed
+    to the main loop is not overwritten while it is in use.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)
+        self.frame = None  # Latest (mirrored BGR frame, small RGB copy for detection)
+        self.frame_id = 0  # Counts frames so the main loop can tell new from old
+        self.buffers = [FrameBuffers() for _ in range(3)]
+        self.newest = None  # Index into `buffers` of the latest frame
+        self.in_use = None  # Index into `buffers` of the frame the main loop holds
+        self.failed = False
+        self.running = True
+
+    def run(self) -> None:
+        while self.running:
+            with self.lock:
+                index = next(i for i in range(len(self.buffers)) if i not in (self.newest, self.in_use))
+            buffers = self.buffers[index]
+            # Each OpenCV call writes into the given array (or returns a new one
+            # if the size changed, which is then kept for next time).
+            ret, buffers.raw = self.cap.read(buffers.raw) if buffers.raw is not None else self.cap.read()
+            if not ret or buffers.raw is None:
+                with self.new_frame:
+                    self.failed = True
+                    self.new_frame.notify_all()
+                return
+            # Mirror the frame so movement feels natural.
+            buffers.flipped = cv2.flip(buffers.raw, 1, dst=buffers.flipped)
+            small = shrink_for_inference(buffers.flipped, dst=buffers.small)
+            if small is not buffers.flipped:
+                buffers.small = small
+            buffers.rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=buffers.rgb)
+            # Read-only input lets MediaPipe use the pixels in place instead of
+            # copying them; a view keeps the reused buffer itself writable.
+            rgb = buffers.rgb.view()
+            rgb.flags.writeable = False
+            with self.new_frame:
+                self.frame = (buffers.flipped, rgb)
+                self.newest = index
+                self.frame_id += 1
+                self.new_frame.notify_all()
+
+    def wait_for_frame(self, last_id: int) -> Optional[Tuple[int, np.ndarray, np.ndarray]]:
+        """Wait for a frame newer than `last_id`; return (id, frame, rgb), or None if the camera stopped."""
+        with self.new_frame:
+            self.new_frame.wait_for(lambda: self.frame_id != last_id or self.failed, FRAME_WAIT_SECONDS)
+            if self.frame_id == last_id:
+                return None
+            frame, rgb = self.frame
+            # The previous frame is released; this one is now off limits for the thread.
+            self.in_use = self.newest
+            return self.frame_id, frame, rgb
+
+    def stop(self) -> None:
+        """Ask the thread to finish and wait for its current read to return."""
+        self.running = False
+        self.join(timeout=FRAME_WAIT_SECONDS)
+
+
+class LiveHandLandmarker:
+    """Hand detection with MediaPipe's newer HandLandmarker, run in LIVE_STREAM mode.
+
+    `process` only hands the frame over and returns at once; MediaPipe detects on
+    its own thread and calls `_on_result` when done. Until a newer result arrives
+    the game keeps using the last one, so the loop never waits on detection.
+    Results are shaped like the classic `Hands.process` output (an object with a
+    `multi_hand_landmarks` list), so the rest of the game does not care which
+    detector is running.
+    """
+
+    def __init__(self, model_path: str) -> None:
+        # Deferred import: only needed when the optional model file is present.
+        from mediapipe.framework.formats import landmark_pb2  # noqa: WPS433 - intentional runtime import
+
+        self.landmark_pb2 = landmark_pb2
+        # Replaced as a whole by the callback, so the game never sees a half-updated result.
+        self.latest = SimpleNamespace(multi_hand_landmarks=None)
+        self.timestamp_ms = 0
+        vision = mp.tasks.vision
+        base_options = mp.tasks.BaseOptions
+        for delegate in (base_options.Delegate.GPU, base_options.Delegate.CPU):
+            options = vision.HandLandmarkerOptions(
+                base_options=base_options(model_asset_path=model_path, delegate=delegate),
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                num_hands=1,
+                min_hand_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+                result_callback=self._on_result,
+            )
+            try:
+                self.landmarker = vision.HandLandmarker.create_from_options(options)
+                break
+            except (RuntimeError, NotImplementedError):
+                # No GPU support on this machine/platform: try again on the CPU.
+                if delegate == base_options.Delegate.CPU:
+                    raise
+
+    def _on_result(self, result, image, timestamp_ms: int) -> None:
+        if not result.hand_landmarks:
+            self.latest = SimpleNamespace(multi_hand_landmarks=None)
+            return
+        # Convert to the classic landmark list so drawing_utils can draw it too.
+        hand = self.landmark_pb2.NormalizedLandmarkList()
+        hand.landmark.extend(
+            self.landmark_pb2.NormalizedLandmark(x=point.x, y=point.y, z=point.z) for point in result.hand_landmarks[0]
+        )
+        self.latest = SimpleNamespace(multi_hand_landmarks=[hand])
+
+    def process(self, rgb: np.ndarray) -> SimpleNamespace:
+        """Queue `rgb` for detection and return the latest finished result."""
+        # Timestamps must keep increasing, even if two frames land in the same millisecond.
+        self.timestamp_ms = max(self.timestamp_ms + 1, int(time.perf_counter() * 1000))
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        self.landmarker.detect_async(image, self.timestamp_ms)
+        return self.latest
+
+    def close(self) -> None:
+        self.landmarker.close()
+
+
+def create_hand_detector(mp_hands):
+    """Use the faster HandLandmarker when its model file is around, else the classic Hands solution."""
+    if os.path.isfile(HAND_MODEL_PATH):
+        return LiveHandLandmarker(HAND_MODEL_PATH)
+    return mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+
+
 def main() -> None:
     # Initialize camera
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("[Error] Cannot open webcam. Please check that a camera is connected and not in use.")
         return
+    # Keep only the newest frame in the driver queue, so what the grabber
+    # thread reads is never several frames old.
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    # Ask for compressed (MJPG) frames at a modest size: less USB traffic and
+    # fewer pixels to convert and analyze. Cameras that cannot do this keep
+    # their defaults, and the game adapts to whatever size arrives below.
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
+    cap.set(cv2.CAP_PROP_FPS, CAPTURE_FPS)
 
     # Precompute frame size after first read to place stickman at center.
     ret, frame = cap.read()
@@ -215,47 +498,78 @@ def main() -> None:
     # Load MediaPipe helpers with extra validation so beginners get friendlier errors.
     mp_hands, mp_drawing, mp_styles = load_mediapipe_components()
 
-    hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.5, min_tracking_confidence=0.5)
-
+    hands = create_hand_detector(mp_hands)
+    # The first detection sets up the model and is many times slower than the
+    # rest; run it now on the startup frame so the round does not open with a stall.
+    hands.process(cv2.cvtColor(shrink_for_inference(cv2.flip(frame, 1)), cv2.COLOR_BGR2RGB))
+
+    # Look these up once: the landmark indices never change, and the default
+    # drawing styles would otherwise be rebuilt on every frame.
+    thumb_tip_idx = int(mp_hands.HandLandmark.THUMB_TIP)
+    index_tip_idx = int(mp_hands.HandLandmark.INDEX_FINGER_TIP)
+    draw_landmarks = mp_drawing.draw_landmarks
+    hand_connections = mp_hands.HAND_CONNECTIONS
+    landmark_style = mp_styles.get_default_hand_landmarks_style()
+    connection_style = mp_styles.get_default_hand_connections_style()
+
+    debug_draw = DEBUG_DRAW
     pinch_on = False
     hold_counter = 0
     release_counter = 0
     score = 0
     frame_count = 0
-    start_time = time.time()
-    fps_time = time.time()
+    loop_index = 0
+    result = None
+    # perf_counter is a steady clock meant for measuring durations (wall-clock
+    # time can jump if the system clock is adjusted mid-game).
+    start_time = time.perf_counter()
+    fps_time = start_time
     fps = 0.0
 
+    # From here on the camera is read on its own thread (see FrameGrabber).
+    grabber = FrameGrabber(cap)
+    grabber.start()
+    frame_id = 0
+
     while True:
-        ret, frame = cap.read()
-        if not ret or frame is None:
+        latest = grabber.wait_for_frame(frame_id)
+        if latest is None:
             print("[Warning] Frame grab failed. Ending game loop.")
             break
-
-        # Mirror the frame so movement feels natural.
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = hands.process(rgb)
-
-        pinch_distance = 1.0  # Default large distance when no hand detected.
-        pinch_now = False
-
-        if result.multi_hand_landmarks:
-            hand_landmarks = result.multi_hand_landmarks[0]
-            thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-            index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-            dx = thumb_tip.x - index_tip.x
-            dy = thumb_tip.y - index_tip.y
-            pinch_distance = math.hypot(dx, dy)
-            pinch_now = pinch_distance < PINCH_THRESHOLD
-
-            # Draw hand landmarks to help learners see the detection output live.
-            mp_drawing.draw_landmarks(
+        frame_id, frame, rgb = latest
+
+        # Hand detection is the slowest step, so on most frames we reuse the
+        # last result. Detect fresh whenever the debounce is one frame away
+        # from flipping, so a pinch only turns ON/OFF on up-to-date input.
+        about_to_flip = (
+            (not pinch_on and abs(hold_counter - HOLD_FRAMES) <= 1)
+            or (pinch_on and abs(release_counter - RELEASE_FRAMES) <= 1)
+        )
+        if result is None or loop_index % INFER_EVERY == 0 or about_to_flip:
+            result = hands.process(rgb)
+            # Measure the pinch once per detection; reused frames keep these values.
+            pinch_distance = 1.0  # Default large distance when no hand detected.
+            pinch_now = False
+            if result.multi_hand_landmarks:
+                landmarks = result.multi_hand_landmarks[0].landmark
+                dx = landmarks[thumb_tip_idx].x - landmarks[index_tip_idx].x
+                dy = landmarks[thumb_tip_idx].y - landmarks[index_tip_idx].y
+                # Squared distances compare the same way, so the test needs no sqrt;
+                # the square root is only taken for the HUD readout.
+                distance_sq = dx * dx + dy * dy
+                pinch_now = distance_sq < _PINCH_THRESHOLD_SQ
+                pinch_distance = math.sqrt(distance_sq)
+        loop_index += 1
+
+        # Draw hand landmarks to help learners see the detection output live.
+        # Off by default: it is the priciest drawing call in the loop.
+        if debug_draw and result.multi_hand_landmarks:
+            draw_landmarks(
                 frame,
-                hand_landmarks,
-                mp_hands.HAND_CONNECTIONS,
-                landmark_drawing_spec=mp_styles.get_default_hand_landmarks_style(),
-                connection_drawing_spec=mp_styles.get_default_hand_connections_style(),
+                result.multi_hand_landmarks[0],
+                hand_connections,
+                landmark_drawing_spec=landmark_style,
+                connection_drawing_spec=connection_style,
             )
 
         # Debounce logic: only switch states after consistent frames.
@@ -270,13 +584,14 @@ def main() -> None:
             if pinch_on and release_counter >= RELEASE_FRAMES:
                 pinch_on = False
 
-        # Update timer and compute FPS.
-        elapsed = time.time() - start_time
+        # Update timer and compute FPS (one clock reading keeps both consistent).
+        now = time.perf_counter()
+        elapsed = now - start_time
         remaining = max(0.0, GAME_DURATION - elapsed)
-        if time.time() - fps_time >= 0.5:
-            fps = frame_count / (time.time() - fps_time)
+        if now - fps_time >= 0.5:
+            fps = frame_count / (now - fps_time)
             frame_count = 0
-            fps_time = time.time()
+            fps_time = now
         frame_count += 1
 
         # Draw stickman and slash (if active).
@@ -288,19 +603,17 @@ def main() -> None:
         else:
             slash_start, slash_end = right_hand, right_hand
 
-        # Update and draw targets. Freeze when time is up.
-        for idx, target in enumerate(targets):
-            if remaining > 0:
-                target.move(width, height)
-            cv2.circle(frame, tuple(target.position.astype(int)), TARGET_RADIUS, (0, 180, 80), -1)
+        # Move targets and check hits in one step. Freeze when time is up;
+        # hits only count while the slash is active.
+        hits: List[int] = []
+        if remaining > 0:
+            hits = targets.step(width, height, (slash_start, slash_end) if pinch_on else None)
 
-        # Check hits only when slash is active and time remains.
-        if pinch_on and remaining > 0:
-            hits = check_hits(targets, slash_start, slash_end)
-            if hits:
-                score += SCORE_PER_HIT * len(hits)
-                for hit_idx in hits:
-                    targets[hit_idx].respawn(width, height)
+        # Draw targets (a target that was just hit shows one last time where it was struck).
+        draw_targets(frame, targets.pixel_positions())
+        if hits:
+            score += SCORE_PER_HIT * len(hits)
+            targets.respawn(hits, width, height)
 
         # HUD and timer end message.
         draw_hud(frame, score, remaining, pinch_on, pinch_distance, fps)
@@ -313,15 +626,18 @@ def main() -> None:
         key = cv2.waitKey(1) & 0xFF
         if key == ord('q'):
             break
+        if key == ord('d'):
+            debug_draw = not debug_draw
         if key == ord('r'):
             # Reset game state
             score = 0
-            start_time = time.time()
+            start_time = time.perf_counter()
             targets = create_targets(width, height)
             pinch_on = False
             hold_counter = 0
             release_counter = 0
 
+    grabber.stop()
     cap.release()
     hands.close()
     cv2.destroyAllWindows()
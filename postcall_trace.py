@@ -21,49 +21,152 @@ The resulting directory includes:
 44_sanitize_reasons.json, and index.json (with new metadata fields).
 
 Developer note:
-This module uses only the standard library and keeps extra inline comments so
-future contributors can reason about the redaction rules quickly.
+This module uses only the standard library (orjson, when installed, just
+speeds up writing the JSON files) and keeps extra inline comments so future
+contributors can reason about the redaction rules quickly.
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
+try:
+    # Optional speedup: orjson writes the (large) trace snapshots several
+    # times faster than the stdlib's pure-Python indent path. Bundles stay
+    # dependency-free, so we quietly fall back when it is not installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None  # type: ignore[assignment]
 
-def _sha256_hex(value: str) -> str:
-    """Return a SHA-256 hex digest for consistent hash fields."""
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
+# Strings are hashed in slices of this many characters (see _sha256_hex).
+_HASH_CHUNK_CHARS = 64 * 1024
+# Fresh, never-updated context; copying it is cheaper than hashlib.sha256().
+_new_sha256 = hashlib.sha256().copy
 
-def _today_str() -> str:
-    """Date helper for folder naming (UTC keeps logs timezone-agnostic)."""
-    return datetime.utcnow().strftime("%Y%m%d")
 
+def _sha256_hex(value: str | bytes) -> str:
+    """
+    Return a SHA-256 hex digest for consistent hash fields.
+
+    Already-encoded ``bytes`` are hashed as they are. Long ``str`` values
+    (multi-MB raw prompts) are encoded and fed to the hash in slices, so a
+    full UTF-8 copy of the text never exists at once. Slicing a ``str``
+    never splits a code point, so the digest is the same either way.
+    """
+    digest = _new_sha256()
+    if isinstance(value, bytes):
+        digest.update(value)
+        return digest.hexdigest()
+    for offset in range(0, len(value), _HASH_CHUNK_CHARS):
+        digest.update(value[offset : offset + _HASH_CHUNK_CHARS].encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Value types a message fingerprint may hold. Floats are left out because
+# equal floats can still serialize differently (0.0 vs -0.0); the type is
+# stored next to each value so 1 and True do not share a cache entry.
+_FINGERPRINT_TYPES = frozenset({str, int, bool, type(None)})
+
+
+# json.dumps builds a fresh JSONEncoder whenever it gets non-default options;
+# these are built once and reused (encode keeps no state between calls).
+_encode_sorted = json.JSONEncoder(sort_keys=True).encode
+_encode_pretty = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_redacted(fingerprint: Tuple[Tuple[Tuple[str, type, Any], ...], ...]) -> str:
+    """Hash the messages described by ``fingerprint`` exactly as ``json.dumps`` would."""
+    messages = [{key: value for key, _, value in message} for message in fingerprint]
+    return _sha256_hex(_encode_sorted(messages))
+
+
+def _redacted_messages_hash(messages: List[Dict[str, Any]]) -> str:
+    """
+    Return the ``promptHashRedacted`` digest, memoized for repeated payloads.
+
+    Retries and replays often send the same redacted messages again, so flat
+    messages are reduced to a hashable fingerprint that keys the cache.
+    Anything nested or unusual skips the cache and is hashed directly.
+    """
+    fingerprint = []
+    for message in messages:
+        items = []
+        for key, value in message.items():
+            value_type = type(value)
+            if type(key) is not str or value_type not in _FINGERPRINT_TYPES:
+                return _sha256_hex(_encode_sorted(messages))
+            items.append((key, value_type, value))
+        fingerprint.append(tuple(items))
+    return _hash_redacted(tuple(fingerprint))
+
+
+# (epoch seconds the cached UTC day starts and ends, its "YYYYMMDD") for _today_str.
+_today_cache: Tuple[float, float, str] = (0.0, 0.0, "")
 
-def _ensure_redacted_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+def _today_str(now: Optional[float] = None) -> str:
+    """
+    Date helper for folder naming (UTC keeps logs timezone-agnostic).
+
+    ``now`` is an optional ``time.time()`` reading, so callers can keep the
+    folder and their timestamps on the same instant. The string only changes
+    at UTC midnight, so it is cached until then instead of being formatted
+    again for every bundle.
+    """
+    global _today_cache
+    if now is None:
+        now = time.time()
+    day_start, day_end, day = _today_cache
+    if not day_start <= now < day_end:
+        day_start = now // 86400 * 86400  # UTC days are exactly 86400 epoch seconds.
+        day = datetime.utcfromtimestamp(now).strftime("%Y%m%d")
+        _today_cache = (day_start, day_start + 86400, day)
+    return day
+
+
+# Message keys _ensure_redacted_messages masks, and the mask it writes.
+_REDACTED_KEYS = frozenset({"content", "text", "transcript", "raw"})
+_REDACTED = "[REDACTED]"
+
+
+def _ensure_redacted_messages(
+    messages: List[Dict[str, Any]], *, already_redacted: bool = False
+) -> List[Dict[str, Any]]:
     """
     Shallowly redact common sensitive keys in a message list.
 
     The goal is defensive: even if the caller accidentally passes raw content,
     we mask the obvious places before writing to disk. This keeps the bundle
     safe-by-default while still preserving message order/roles.
+
+    Copies are only made when something actually needs masking: a list that
+    is already fully masked (or flagged ``already_redacted`` by a caller that
+    guarantees it) is returned as-is, and so is any message without one of
+    the masked keys.
     """
-    redacted_messages: List[Dict[str, Any]] = []
-    for message in messages:
-        copy = dict(message)
-        # Mask popular content fields; callers can still provide pre-redacted
-        # strings like "[REDACTED]" which will be preserved as-is.
-        for key in ("content", "text", "transcript", "raw"):
-            if key in copy:
-                copy[key] = "[REDACTED]"
-        redacted_messages.append(copy)
-    return redacted_messages
+    if already_redacted or all(
+        message.get(key, _REDACTED) == _REDACTED for message in messages for key in _REDACTED_KEYS
+    ):
+        return messages
+
+    # Mask popular content fields. The set intersection finds the ones a
+    # message has in one C-level step, and ``|`` keeps every key in place.
+    return [
+        message | dict.fromkeys(present, _REDACTED) if (present := _REDACTED_KEYS & message.keys()) else message
+        for message in messages
+    ]
 
 
 def _redact_preview(text: Optional[str], *, limit: int = 120) -> str:
@@ -79,8 +182,19 @@ def _redact_preview(text: Optional[str], *, limit: int = 120) -> str:
     if not text:
         return ""
 
+    text = str(text)
+    # Long texts: collapse only a window at the front. Its squished form is
+    # always a prefix of the full one, so if it already runs past ``limit``
+    # the rest of the text cannot change the preview.
+    window = 4 * limit
+    if limit >= 3 and len(text) > window:
+        head = " ".join(text[:window].split())
+        if len(head) > limit:
+            return f"{head[: limit - 3]}..."
+
     # Collapse whitespace so previews read cleanly in the UI.
-    squished = " ".join(str(text).split())
+    # (str.split + join beats a precompiled \s+ regex several times over.)
+    squished = " ".join(text.split())
     if len(squished) <= limit:
         return squished
     return f"{squished[: limit - 3]}..."
@@ -102,10 +216,21 @@ def _extract_turn_text(turn: Any) -> str:
         return turn
 
     if isinstance(turn, dict):
-        for key in ("text", "content", "turnText", "message"):
-            candidate = turn.get(key)
-            if isinstance(candidate, str):
-                return candidate
+        # Unrolled "text", "content", "turnText", "message" lookup: cheaper
+        # than looping over a key tuple for every turn.
+        get = turn.get
+        candidate = get("text")
+        if isinstance(candidate, str):
+            return candidate
+        candidate = get("content")
+        if isinstance(candidate, str):
+            return candidate
+        candidate = get("turnText")
+        if isinstance(candidate, str):
+            return candidate
+        candidate = get("message")
+        if isinstance(candidate, str):
+            return candidate
 
     return ""
 
@@ -124,6 +249,19 @@ def _extract_turns(trace: Dict[str, Any]) -> List[str]:
     return []
 
 
+# (has snippet, snippet found, value found) -> (reason, matchedBy) when no
+# offset was fixed; a fixed offset always wins the reason. A found snippet
+# implies one was given, so (False, True, *) never occurs.
+_MATCH_OUTCOMES: Dict[Tuple[bool, bool, bool], Tuple[ReasonCode, MatchedBy]] = {
+    (True, True, True): ("ok", "snippet"),
+    (True, True, False): ("ok", "snippet"),
+    (True, False, True): ("snippet_not_found", "value"),
+    (True, False, False): ("snippet_not_found", "none"),
+    (False, False, True): ("ok", "value"),
+    (False, False, False): ("value_not_found", "none"),
+}
+
+
 def sanitizeExtractionTrace(extraction_trace: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Sanitize an extraction trace and produce a reason-rich report.
@@ -131,9 +269,13 @@ def sanitizeExtractionTrace(extraction_trace: Dict[str, Any]) -> Tuple[Dict[str,
     Returns a tuple of:
     1) sanitized trace with any offset fixes applied, and
     2) per-field reasons that explain how each value/snippet was matched.
+
+    Fields whose offsets need no fix are passed through as the caller's own
+    dicts rather than copies; fixed fields are fresh copies.
     """
 
-    turns = _extract_turns(extraction_trace)
+    turns = tuple(_extract_turns(extraction_trace))
+    turns_len = len(turns)
     per_field_raw = extraction_trace.get("perField") or extraction_trace.get("fields") or []
 
     sanitized_fields: List[Dict[str, Any]] = []
@@ -141,69 +283,88 @@ def sanitizeExtractionTrace(extraction_trace: Dict[str, Any]) -> Tuple[Dict[str,
     invalid_evidence_count = 0
     fixed_offset_count = 0
 
+    # Local aliases: this loop runs once per field, so skip the global lookups.
+    _is = isinstance
+    _prev = _redact_preview
+    outcomes = _MATCH_OUTCOMES
+    add_field = sanitized_fields.append
+    add_report = per_field_report.append
+    # Fields often repeat a snippet/value against the same turn, so each
+    # (turnIndex, text) substring search runs only once per trace.
+    search_results: Dict[Tuple[int, str], bool] = {}
+    seen = search_results.get
+
     for field in per_field_raw:
-        field_copy = dict(field)  # Avoid mutating caller data.
-        turn_index = field.get("turnIndex")
-        turn_text = None
+        get = field.get
+        field_copy = field  # Copied only if an offset changes (never mutate caller data).
+        turn_index = get("turnIndex")
+        requested_snippet = get("requestedSnippet") or get("snippet") or get("evidence")
+        value = get("value")
 
-        if isinstance(turn_index, int) and 0 <= turn_index < len(turns):
+        if _is(turn_index, int) and 0 <= turn_index < turns_len:
             turn_text = turns[turn_index]
+            start_char = get("startChar")
+            end_char = get("endChar")
+            offset_fixed = False
+
+            # Offsets: clamp to safe ranges so downstream readers never fail on out-of-range slicing.
+            start_is_int = _is(start_char, int)
+            end_is_int = _is(end_char, int)
+            if start_is_int or end_is_int:
+                text_len = len(turn_text)
+                start = start_char if start_is_int else 0
+                end = end_char if end_is_int else text_len
+                # Same as max(0, min(start, text_len)) and
+                # max(fixed_start, min(end, text_len)), minus four builtin calls.
+                fixed_start = 0 if start <= 0 else (text_len if start > text_len else start)
+                fixed_end = end if end <= text_len else text_len
+                if fixed_end <= fixed_start:
+                    fixed_end = fixed_start
+                if fixed_start != start or fixed_end != end:
+                    fixed_offset_count += 1
+                    offset_fixed = True
+                # Identity check: an offset that is already the exact same
+                # value (and type) needs no copy; anything else gets one.
+                if fixed_start is not start_char or fixed_end is not end_char:
+                    field_copy = dict(field)
+                    field_copy["startChar"] = fixed_start
+                    field_copy["endChar"] = fixed_end
+
+            snippet_found = False
+            has_snippet = bool(requested_snippet)
+            if has_snippet:
+                key = (turn_index, requested_snippet)
+                cached = seen(key)
+                if cached is None:
+                    cached = search_results[key] = requested_snippet in turn_text
+                snippet_found = cached
+            value_found = False
+            if value:
+                key = (turn_index, str(value))
+                cached = seen(key)
+                if cached is None:
+                    cached = search_results[key] = key[1] in turn_text
+                value_found = cached
+            reason, matched_by = outcomes[(has_snippet, snippet_found, value_found)]
+            if offset_fixed:
+                reason = "offset_fixed"
         else:
             invalid_evidence_count += 1
+            turn_text = None
+            reason, matched_by = "invalid_turnIndex", "none"
 
-        requested_snippet = field.get("requestedSnippet") or field.get("snippet") or field.get("evidence")
-        value = field.get("value")
-        start_char = field.get("startChar")
-        end_char = field.get("endChar")
-
-        matched_by: MatchedBy = "none"
-        reason: ReasonCode = "ok"
-
-        # Offsets: clamp to safe ranges so downstream readers never fail on out-of-range slicing.
-        if turn_text is not None and (isinstance(start_char, int) or isinstance(end_char, int)):
-            text_len = len(turn_text)
-            start = start_char if isinstance(start_char, int) else 0
-            end = end_char if isinstance(end_char, int) else text_len
-            fixed_start = max(0, min(start, text_len))
-            fixed_end = max(fixed_start, min(end, text_len))
-            if fixed_start != start or fixed_end != end:
-                fixed_offset_count += 1
-                reason = "offset_fixed"
-            field_copy["startChar"] = fixed_start
-            field_copy["endChar"] = fixed_end
-
-        if turn_text is None:
-            reason = "invalid_turnIndex"
-        else:
-            snippet_found = bool(requested_snippet) and requested_snippet in turn_text
-            value_found = bool(value) and str(value) in turn_text
-
-            if snippet_found:
-                matched_by = "snippet"
-                # Keep the stronger offset_fixed reason if it was already set.
-                reason = reason if reason == "offset_fixed" else "ok"
-            elif requested_snippet:
-                reason = "offset_fixed" if reason == "offset_fixed" else "snippet_not_found"
-                matched_by = "value" if value_found else "none"
-            elif value_found:
-                matched_by = "value"
-                reason = reason if reason == "offset_fixed" else "ok"
-            else:
-                matched_by = "none"
-                reason = reason if reason == "offset_fixed" else "value_not_found"
-
-        per_field_report.append(
+        add_report(
             {
-                "field": field.get("field") or field.get("name") or field.get("path") or "",
+                "field": get("field") or get("name") or get("path") or "",
                 "turnIndex": turn_index,
                 "reason": reason,
                 "matchedBy": matched_by,
-                "turnTextPreview": _redact_preview(turn_text),
-                "snippetPreview": _redact_preview(requested_snippet),
-                "valuePreview": _redact_preview(value),
+                "turnTextPreview": _prev(turn_text),
+                "snippetPreview": _prev(requested_snippet),
+                "valuePreview": _prev(value),
             }
         )
-        sanitized_fields.append(field_copy)
+        add_field(field_copy)
 
     sanitized_trace = {"turns": [{"text": text} for text in turns], "perField": sanitized_fields}
     sanitize_report = {
@@ -239,16 +400,340 @@ def format_sanitize_report(report: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    """Small helper to write pretty JSON with UTF-8 encoding."""
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+# Sanitize reasons that mean a field's evidence is missing or unusable.
+_MISSING_REASONS = frozenset({"invalid_turnIndex", "snippet_not_found", "value_not_found"})
+
+
+def _dict_items(value: Any) -> List[Dict[str, Any]]:
+    """Return the dict entries of a list/tuple (other values and entries are ignored)."""
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def missing_field_count(trace_final: Any, sanitize_reasons: Any) -> int:
+    """
+    Estimate how many extraction fields look incomplete.
+
+    We combine two signals:
+    - sanitize_reasons per-field reasons that indicate missing/invalid evidence.
+    - trace_final perField entries that lack a value.
+
+    Shared by the writer (on the in-memory snapshots) and dev_log_viewer (on
+    the parsed files), so both give the same answer. Checks use isinstance,
+    which treats a snapshot and its JSON round trip alike; anything that is
+    not the expected dict/list shape is skipped, never raised on.
+    """
+    per_field_report = sanitize_reasons.get("perField") if isinstance(sanitize_reasons, dict) else None
+    missing = sum(
+        1
+        for field in _dict_items(per_field_report)
+        if field.get("reason") in _MISSING_REASONS or field.get("matchedBy") == "none"
+    )
+    extraction_trace = trace_final.get("extractionTrace") if isinstance(trace_final, dict) else None
+    if isinstance(extraction_trace, dict):
+        missing += sum(
+            1
+            for field in _dict_items(extraction_trace.get("perField"))
+            if not field.get("value") and not field.get("requestedSnippet")
+        )
+    return missing
+
+
+def usage_token_count(response_meta: Any) -> Optional[int]:
+    """
+    Calculate total tokens from an OpenAI usage object if present.
+
+    Shared with dev_log_viewer like :func:`missing_field_count`.
+    """
+    usage = response_meta.get("usage") if isinstance(response_meta, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    # bool is an int subclass, but a bundle file stores it as true/false.
+    prompt = usage.get("prompt_tokens")
+    if not isinstance(prompt, int) or isinstance(prompt, bool):
+        return None
+    completion = usage.get("completion_tokens")
+    if isinstance(completion, int) and not isinstance(completion, bool):
+        return int(prompt) + int(completion)
+    return int(prompt)
+
+
+def _inventory_summary(
+    trace_final: Dict[str, Any], sanitize_reasons: Dict[str, Any], response_meta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Precompute the list-view numbers dev_log_viewer would otherwise derive.
+
+    Stored under ``index.json["inventory"]`` so the viewer's run list can
+    read one file per bundle instead of four; the viewer derives the same
+    numbers for older bundles with the same two helpers.
+    """
+    return {
+        "missingCount": missing_field_count(trace_final, sanitize_reasons),
+        "tokenCount": usage_token_count(response_meta),
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _response_format_cached(name: str) -> Dict[str, Any]:
+    return {"name": name}
+
+
+def _response_format_fragment(name: Any) -> Dict[str, Any]:
+    """
+    Return the ``{"name": ...}`` response_format fragment for a request payload.
+
+    Production runs use a handful of fixed names, so string names share one
+    cached dict across bundles. The fragment is only ever serialized, never
+    mutated, which is what makes sharing it safe.
+    """
+    if isinstance(name, str):
+        return _response_format_cached(name)
+    return {"name": name}
+
+
+# Types both encoders write the same way; container types are walked.
+_PLAIN_JSON_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_matches_stdlib(payload: Any) -> bool:
+    """
+    Return True when orjson would write ``payload`` exactly as the stdlib does.
+
+    Only plain JSON types qualify (exact types, not subclasses). orjson also
+    serializes datetime, UUID, Enum, dataclass and numpy values (as keys
+    too, with ``OPT_NON_STR_KEYS``) that the stdlib rejects with TypeError,
+    so those payloads go to the stdlib and fail the same way either way.
+    orjson writes NaN/Infinity as ``null`` (the stdlib writes ``NaN``) and
+    drops the ``+``/leading zero in exponents (``1e16`` vs ``1e+16``,
+    ``1e-7`` vs ``1e-07``); both print zero and every finite float in
+    ``[1e-4, 1e16)`` identically, so floats outside that range are refused.
+    """
+    plain = _PLAIN_JSON_SCALARS
+    stack = [payload]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        value = pop()
+        kind = type(value)
+        if kind in plain:
+            continue
+        if kind is float:
+            if value and not 1e-4 <= abs(value) < 1e16:
+                return False  # Also False for NaN, whose comparisons all fail.
+        elif kind is dict:
+            extend(value.values())
+            extend(value.keys())
+        elif kind is list or kind is tuple:
+            extend(value)
+        else:
+            return False
+    return True
+
+
+def _json_bytes(payload: Dict[str, Any]) -> bytes:
+    """
+    Small helper to encode pretty JSON as UTF-8 bytes.
+
+    orjson is used only when its output is byte-identical to the stdlib's
+    (see ``_orjson_matches_stdlib``), so whether a bundle is written, and
+    what it contains, never depends on whether orjson is installed.
+    """
+    if orjson is not None and _orjson_matches_stdlib(payload):
+        try:
+            # Same two-space layout as the stdlib path, already UTF-8 encoded.
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which only the stdlib can write.
+    return _encode_pretty(payload).encode("utf-8")
+
+
+# Binary, create-or-truncate; O_BINARY only exists (and matters) on Windows.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Write ``data`` to ``path`` with raw ``os.open``/``os.write`` (no text or buffer layer).
+
+    ``fsync`` also flushes the file to stable storage before closing it.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        _write_fd(fd, data, fsync)
+    finally:
+        os.close(fd)
+
+
+def _write_fd(fd: int, data: bytes, fsync: bool) -> None:
+    """Write all of ``data`` to an open descriptor (``os.write`` may write less)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if fsync:
+        os.fsync(fd)
 
 
-def _write_text(path: Path, text: str) -> None:
-    """Write plain UTF-8 text to disk."""
-    path.write_text(text, encoding="utf-8")
+# Linux only: an unnamed file in a directory, given a name later via os.link.
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
 
 
+def _publish_file(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Write ``data`` so that ``path`` appears complete or not at all.
+
+    On Linux the bytes go into an unnamed ``O_TMPFILE`` that is linked in
+    under its final name once written, so a crash leaves neither a torn file
+    nor a stray temp file. Elsewhere, on filesystems without ``O_TMPFILE``, or
+    when ``path`` already exists (a link cannot replace it), a temp file is
+    renamed over ``path`` instead, which is just as atomic for readers.
+    """
+    if _O_TMPFILE and not os.path.lexists(path):
+        try:
+            fd = os.open(path.parent, _O_TMPFILE | os.O_WRONLY, 0o666)
+        except OSError:
+            fd = -1  # e.g. EOPNOTSUPP: this filesystem has no unnamed files.
+        if fd >= 0:
+            try:
+                _write_fd(fd, data, fsync)
+                try:
+                    os.link(f"/proc/self/fd/{fd}", path)
+                    return
+                except OSError:
+                    pass  # /proc not mounted, or another writer got there first.
+            finally:
+                os.close(fd)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _write_file(tmp, data, fsync)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries (new files and links) to disk; a no-op where unsupported."""
+    if os.name != "posix":
+        return  # Windows cannot open directories for fsync; NTFS journals entries itself.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+_write_pool: Optional[ThreadPoolExecutor] = None
+_write_pool_lock = threading.Lock()
+
+
+def _get_write_pool() -> ThreadPoolExecutor:
+    """Shared writer threads, started on first use so importing stays cheap."""
+    global _write_pool
+    with _write_pool_lock:
+        if _write_pool is None:
+            _write_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="postcall-write")
+        return _write_pool
+
+
+def _replace_file(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    ``_write_file`` for a bundle file that may already be a hard link.
+
+    A bundle first written with ``share_trace_files`` links its trace files
+    to shared objects. Truncating such a link would rewrite the object, and
+    every other bundle linked to it, in place, so the old name is unlinked
+    and ``path`` gets a fresh file instead.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    _write_file(path, data, fsync)
+
+
+def _write_shared_file(path: Path, data: bytes, objects_root: Path, fsync: bool = False) -> None:
+    """
+    Store ``data`` once under ``objects_root`` by its SHA-256 and hard-link ``path`` to it.
+
+    Objects are created via a temp file and ``os.link`` (which fails if the
+    name exists), so concurrent writers never see a half-written object.
+    They are made read-only: bundle files linked to them must not be edited
+    in place, and an outside write then fails loudly (unless it runs as
+    root, which the mode does not stop) instead of changing every bundle
+    that shares the object. The bundle writer itself always unlinks before
+    writing (see ``_replace_file``). Filesystems without hard links get an
+    ordinary copy.
+    """
+    name = _sha256_hex(data)
+    obj = objects_root / name[:2] / f"{name}.json"
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp = obj.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        _write_file(tmp, data, fsync)
+        os.chmod(tmp, 0o444)
+        try:
+            os.link(tmp, obj)
+        except FileExistsError:
+            pass  # Another writer stored the same content first.
+        finally:
+            os.unlink(tmp)
+        if fsync:
+            _fsync_dir(obj.parent)
+    try:
+        os.unlink(path)  # Rewriting a bundle: drop the old file or link first.
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(obj, path)
+    except OSError:
+        _write_file(path, data, fsync)
+
+
+def _write_files(
+    files: List[Tuple[Path, bytes, bool]],
+    *,
+    parallel: bool = False,
+    objects_root: Optional[Path] = None,
+    fsync: bool = False,
+) -> None:
+    """
+    Write already-encoded bundle files; the last entry (index.json) goes last.
+
+    Everything is serialized before the first file is opened. With
+    ``parallel`` the other files are written concurrently on the shared pool
+    (file writes release the GIL); either way the final file is only
+    published (see ``_publish_file``) once the rest are on disk, so readers
+    never find an index for a half-written bundle, nor a half-written index.
+    Entries flagged as shareable are content-addressed under ``objects_root``
+    when one is given (see ``_write_shared_file``). ``fsync`` makes each
+    file, and finally the folder holding them, durable before returning; the
+    other files are synced before index.json is written.
+    """
+    *body_files, (last_path, last_data, _) = files
+    body = [
+        (_write_shared_file, (path, data, objects_root, fsync))
+        if shared and objects_root is not None
+        else (_replace_file, (path, data, fsync))
+        for path, data, shared in body_files
+    ]
+    if parallel and len(body) > 1:
+        futures = [_get_write_pool().submit(write, *args) for write, args in body]
+        for future in futures:
+            future.result()  # Re-raises the first write error, if any.
+    else:
+        for write, args in body:
+            write(*args)
+    _publish_file(last_path, last_data, fsync)
+    if fsync:
+        _fsync_dir(last_path.parent)
+
+
+@functools.lru_cache(maxsize=1)
 def _safe_git_commit() -> Optional[str]:
     """
     Try to capture the current git commit hash without failing the bundle.
@@ -256,6 +741,10 @@ def _safe_git_commit() -> Optional[str]:
     This runs in ``--quiet`` mode to avoid noisy stderr output when git is
     unavailable (e.g., packaged builds). Returning ``None`` signals "not
     available", which index.json records explicitly.
+
+    The answer is cached for the life of the process, so only the first
+    bundle pays for starting git. Long-running services that deploy in
+    place can call ``_safe_git_commit.cache_clear()`` (e.g. on SIGHUP).
     """
     try:
         result = subprocess.run(
@@ -269,63 +758,87 @@ def _safe_git_commit() -> Optional[str]:
     return result.stdout.strip() or None
 
 
-@dataclass
-class TraceBundlePaths:
-    """
-    File layout helper for a single request bundle.
+_git_commit_prefetch: Optional[Future] = None
 
-    Keeping paths centralized prevents typos and makes the index generation
-    straightforward for future schema updates.
-    """
 
-    root: Path
+def _prefetch_git_commit() -> None:
+    """Warm ``_safe_git_commit``'s cache on the write pool (first call per process only)."""
+    global _git_commit_prefetch
+    if _git_commit_prefetch is not None:
+        return
+    pool = _get_write_pool()
+    with _write_pool_lock:
+        if _git_commit_prefetch is None:
+            _git_commit_prefetch = pool.submit(_safe_git_commit)
+
+
+def _git_commit() -> Optional[str]:
+    """
+    Return the cached commit hash for index.json.
 
-    @property
-    def system_prompt(self) -> Path:
-        return self.root / "05_system_prompt.txt"
+    A prefetch still in flight is waited for rather than racing it with a
+    second ``git`` process; after ``cache_clear()`` this looks up afresh.
+    """
+    if _git_commit_prefetch is not None:
+        _git_commit_prefetch.result()
+    return _safe_git_commit()
 
-    @property
-    def openai_request(self) -> Path:
-        return self.root / "06_openai_request.json"
 
-    @property
-    def openai_response_meta(self) -> Path:
-        return self.root / "21_openai_response_meta.json"
+# index.json "files" entries: key -> file name inside the bundle folder.
+_INDEX_FILE_NAMES: Dict[str, str] = {
+    "systemPrompt": "05_system_prompt.txt",
+    "openaiRequest": "06_openai_request.json",
+    "openaiResponseMeta": "21_openai_response_meta.json",
+    "traceRaw": "41_trace_raw.json",
+    "traceSanitized": "42_trace_sanitized.json",
+    "traceFinal": "43_trace_final.json",
+    "sanitizeReasons": "44_sanitize_reasons.json",
+}
 
-    @property
-    def trace_raw(self) -> Path:
-        return self.root / "41_trace_raw.json"
 
-    @property
-    def trace_sanitized(self) -> Path:
-        return self.root / "42_trace_sanitized.json"
+class TraceBundlePaths:
+    """
+    File layout helper for a single request bundle.
 
-    @property
-    def trace_final(self) -> Path:
-        return self.root / "43_trace_final.json"
+    Keeping paths centralized prevents typos and makes the index generation
+    straightforward for future schema updates. Every path is joined once up
+    front and kept in a slot, so reading one is a plain attribute lookup.
+    """
 
-    @property
-    def sanitize_reasons(self) -> Path:
-        return self.root / "44_sanitize_reasons.json"
+    __slots__ = (
+        "root",
+        "system_prompt",
+        "openai_request",
+        "openai_response_meta",
+        "trace_raw",
+        "trace_sanitized",
+        "trace_final",
+        "sanitize_reasons",
+        "index",
+    )
 
-    @property
-    def index(self) -> Path:
-        return self.root / "index.json"
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        names = _INDEX_FILE_NAMES
+        self.system_prompt = root / names["systemPrompt"]
+        self.openai_request = root / names["openaiRequest"]
+        self.openai_response_meta = root / names["openaiResponseMeta"]
+        self.trace_raw = root / names["traceRaw"]
+        self.trace_sanitized = root / names["traceSanitized"]
+        self.trace_final = root / names["traceFinal"]
+        self.sanitize_reasons = root / names["sanitizeReasons"]
+        self.index = root / "index.json"
+
+    def __repr__(self) -> str:
+        return f"TraceBundlePaths(root={self.root!r})"
 
     def as_index_paths(self) -> Dict[str, str]:
         """
         Convert to relative strings for index.json so consumers can resolve
-        files without hardcoding names.
+        files without hardcoding names. The names never vary, so this is a
+        copy of the module-level table (safe for callers to modify).
         """
-        return {
-            "systemPrompt": self.system_prompt.name,
-            "openaiRequest": self.openai_request.name,
-            "openaiResponseMeta": self.openai_response_meta.name,
-            "traceRaw": self.trace_raw.name,
-            "traceSanitized": self.trace_sanitized.name,
-            "traceFinal": self.trace_final.name,
-            "sanitizeReasons": self.sanitize_reasons.name,
-        }
+        return dict(_INDEX_FILE_NAMES)
 
 
 class PostcallTraceLogger:
@@ -340,6 +853,18 @@ class PostcallTraceLogger:
         Manual strings so operators can bump them intentionally.
     app_version:
         Optional application version to store alongside git commit hash.
+    disable_parallel_write:
+        Write bundle files one by one on the calling thread (handy when
+        stepping through in a debugger).
+    share_trace_files:
+        Store identical trace snapshots (41/42/43) once under
+        ``<log_root>/../objects`` and hard-link bundles to them, which saves
+        disk when a pipeline keeps producing the same traces. Linked files
+        are read-only and must not be edited in place.
+    fsync:
+        Flush every bundle file and its folder to disk before
+        ``write_bundle`` returns, so a bundle survives a crash or power loss.
+        Off by default: the page cache is plenty for day-to-day debugging.
     """
 
     def __init__(
@@ -349,11 +874,19 @@ class PostcallTraceLogger:
         prompt_version: str = "v1",
         schema_version: str = "2024-07-01",
         app_version: Optional[str] = None,
+        disable_parallel_write: bool = False,
+        share_trace_files: bool = False,
+        fsync: bool = False,
     ) -> None:
         self.log_root = Path(log_root)
         self.prompt_version = prompt_version
         self.schema_version = schema_version
         self.app_version = app_version
+        self.disable_parallel_write = disable_parallel_write
+        self.share_trace_files = share_trace_files
+        # Worked out once here rather than per bundle.
+        self._objects_root = self.log_root.parent / "objects"
+        self.fsync = fsync
 
     def write_bundle(
         self,
@@ -370,6 +903,7 @@ class PostcallTraceLogger:
         sanitize_reasons: Dict[str, Any],
         response_format_name: Optional[str] = None,
         git_commit: Optional[str] = None,
+        already_redacted: bool = False,
     ) -> Path:
         """
         Write all bundle artifacts for a single request.
@@ -377,8 +911,19 @@ class PostcallTraceLogger:
         The raw prompt text is only used to compute ``promptHashRaw``; it is
         deliberately never written to disk to satisfy the "never store
         unredacted prompt" constraint.
+
+        Pass ``already_redacted=True`` only when ``redacted_prompt_messages``
+        is guaranteed masked upstream; it skips the defensive masking pass.
         """
-        date_bucket = _today_str()
+        if not git_commit:
+            # Start git in the background; it runs while the files are encoded.
+            _prefetch_git_commit()
+
+        # One clock reading serves the date folder, createdAt and the
+        # generatedAt default, so they always agree (even around midnight).
+        now = time.time()
+        created_at = datetime.utcfromtimestamp(now).isoformat()
+        date_bucket = _today_str(now)
         bundle_root = self.log_root / date_bucket / request_id
         bundle_root.mkdir(parents=True, exist_ok=True)
 
@@ -386,18 +931,21 @@ class PostcallTraceLogger:
 
         # System prompt stays textual for quick reading; assume caller already
         # scrubbed sensitive tokens because we never want to store secrets here.
-        _write_text(paths.system_prompt, system_prompt_redacted)
+        files: List[Tuple[Path, bytes, bool]] = [(paths.system_prompt, system_prompt_redacted.encode("utf-8"), False)]
+        add = files.append
 
         # Normalize and defensively redact the OpenAI request payload.
-        redacted_messages = _ensure_redacted_messages(redacted_prompt_messages)
+        redacted_messages = _ensure_redacted_messages(
+            redacted_prompt_messages, already_redacted=already_redacted
+        )
         openai_request_payload = {
             "model": openai_request_redacted.get("model"),
             "messages": redacted_messages,
-            "response_format": {
-                "name": response_format_name or openai_request_redacted.get("response_format", {}).get("name")
-            },
+            "response_format": _response_format_fragment(
+                response_format_name or openai_request_redacted.get("response_format", {}).get("name")
+            ),
         }
-        _write_json(paths.openai_request, openai_request_payload)
+        add((paths.openai_request, _json_bytes(openai_request_payload), False))
 
         # Response metadata is limited to id/model/usage to avoid leaking
         # generated text.
@@ -405,27 +953,28 @@ class PostcallTraceLogger:
             "id": openai_response_meta.get("id"),
             "model": openai_response_meta.get("model"),
             "usage": openai_response_meta.get("usage"),
-            "generatedAt": openai_response_meta.get("generatedAt") or datetime.utcnow().isoformat(),
+            "generatedAt": openai_response_meta.get("generatedAt") or created_at,
         }
-        _write_json(paths.openai_response_meta, response_meta_payload)
+        add((paths.openai_response_meta, _json_bytes(response_meta_payload), False))
 
         # Trace snapshots: each stage is kept separate so reviewers can
-        # visually diff the transformation pipeline.
-        _write_json(paths.trace_raw, trace_raw)
-        _write_json(paths.trace_sanitized, trace_sanitized)
-        _write_json(paths.trace_final, trace_final)
-        _write_json(paths.sanitize_reasons, sanitize_reasons)
+        # visually diff the transformation pipeline. They are the big,
+        # often-repeated files, so they are the ones that may be shared.
+        add((paths.trace_raw, _json_bytes(trace_raw), True))
+        add((paths.trace_sanitized, _json_bytes(trace_sanitized), True))
+        add((paths.trace_final, _json_bytes(trace_final), True))
+        add((paths.sanitize_reasons, _json_bytes(sanitize_reasons), False))
 
         # Hashes: raw prompt hash uses the unredacted text; redacted hash uses
         # the JSON snapshot so it can be compared safely.
         prompt_hash_raw = _sha256_hex(raw_prompt_text)
-        prompt_hash_redacted = _sha256_hex(json.dumps(redacted_messages, sort_keys=True))
+        prompt_hash_redacted = _redacted_messages_hash(redacted_messages)
 
-        resolved_git_commit = git_commit or _safe_git_commit()
+        resolved_git_commit = git_commit or _git_commit()
 
         index_payload = {
             "requestId": request_id,
-            "createdAt": datetime.utcnow().isoformat(),
+            "createdAt": created_at,
             "promptHashRaw": prompt_hash_raw,
             "promptHashRedacted": prompt_hash_redacted,
             "promptVersion": self.prompt_version,
@@ -433,8 +982,15 @@ class PostcallTraceLogger:
             "appVersion": self.app_version,
             "gitCommit": resolved_git_commit,
             "files": paths.as_index_paths(),
+            "inventory": _inventory_summary(trace_final, sanitize_reasons, response_meta_payload),
         }
-        _write_json(paths.index, index_payload)
+        add((paths.index, _json_bytes(index_payload), False))
+        _write_files(
+            files,
+            parallel=not self.disable_parallel_write,
+            objects_root=self._objects_root if self.share_trace_files else None,
+            fsync=self.fsync,
+        )
 
         return bundle_root
 